@@ -3,6 +3,7 @@
 import logging
 import os
 import sys
+import threading
 from pathlib import Path
 from typing import Any, ClassVar, TextIO
 
@@ -47,18 +48,31 @@ class EthDefiRichHandler(RichHandler):
         self.colour_threads = colour_threads
         self.thread_styles: dict[str, str] = {}
         self.next_thread_style = 0
+        self.thread_styles_lock = threading.Lock()
 
     def get_thread_style(self, thread_name: str) -> str:
-        """Get a stable Rich style for a thread name."""
+        """Get a stable Rich style for a thread name.
+
+        Known threads are a lock-free dict read. The lock is only taken
+        when a new thread name needs to be assigned a palette entry.
+        """
 
         if not self.colour_threads:
             return "log.thread"
 
-        if thread_name not in self.thread_styles:
-            self.thread_styles[thread_name] = self._THREAD_STYLES[self.next_thread_style % len(self._THREAD_STYLES)]
-            self.next_thread_style += 1
+        style = self.thread_styles.get(thread_name)
+        if style is not None:
+            return style
+
+        with self.thread_styles_lock:
+            # Another thread may have assigned the style while we waited
+            style = self.thread_styles.get(thread_name)
+            if style is None:
+                style = self._THREAD_STYLES[self.next_thread_style % len(self._THREAD_STYLES)]
+                self.thread_styles[thread_name] = style
+                self.next_thread_style += 1
 
-        return self.thread_styles[thread_name]
+        return style
 
     def render_message(self, record: logging.LogRecord, message: str) -> Text:
         """Render log message with module and thread context."""
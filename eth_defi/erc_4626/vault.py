@@ -1329,7 +1329,7 @@ class ERC4626Vault(VaultBase):
         total_supply = self.fetch_total_supply(block_identifier)
         if total_supply == 0:
             return Decimal(0)
-        return total_assets / self.fetch_total_supply(block_identifier)
+        return total_assets / total_supply
 
     def fetch_portfolio(
         self,
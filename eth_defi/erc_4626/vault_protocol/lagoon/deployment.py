@@ -16,7 +16,7 @@ import logging
 import os
 import time
 from contextlib import nullcontext
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, replace
 from decimal import Decimal
 from io import StringIO
 from pathlib import Path
@@ -2874,7 +2874,6 @@ def deploy_multichain_lagoon_vault(
         :class:`LagoonMultichainDeployment` with per-chain results.
     """
     from concurrent.futures import ThreadPoolExecutor, as_completed
-    from copy import deepcopy
 
     from eth_defi.token import USDC_NATIVE_TOKEN
 
@@ -2923,10 +2922,11 @@ def deploy_multichain_lagoon_vault(
 
         # Shallow-copy the config so thread-local mutations don't leak.
         # Web3-bound objects (uniswap_v3, aave_v3, etc.) contain thread locks
-        # and cannot be deep-copied. Only ``parameters`` needs a deep copy
-        # because we mutate ``underlying`` below.
+        # and cannot be deep-copied. ``parameters`` needs its own copy
+        # because we mutate ``underlying`` below. It holds only scalar
+        # fields, so a dataclass field copy is enough.
         per_chain_config = copy.copy(chain_configs[chain_name])
-        per_chain_config.parameters = deepcopy(chain_configs[chain_name].parameters)
+        per_chain_config.parameters = replace(chain_configs[chain_name].parameters)
 
         # Auto-resolve underlying token (USDC) per chain if not already set
         if per_chain_config.parameters.underlying is None or per_chain_config.parameters.underlying == "":
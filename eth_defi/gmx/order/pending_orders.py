@@ -46,6 +46,13 @@ CANCELLABLE_ORDER_TYPES: frozenset[OrderType] = frozenset(
     }
 )
 
+#: How many orders :func:`fetch_pending_orders` asks the Reader for in its first read.
+#:
+#: The DataStore clamps the requested range to the account's order count, so
+#: one ``getAccountOrders`` call covers a typical account without a separate
+#: count query. Only a full page triggers the count lookup for the remainder.
+PENDING_ORDERS_PAGE_SIZE = 100
+
 
 @dataclass(slots=True)
 class PendingOrder:
@@ -280,34 +287,40 @@ def fetch_pending_orders(
     :return:
         Iterator of :class:`PendingOrder` instances matching the filters.
     """
-    order_count = fetch_pending_order_count(web3, chain, account)
-
-    if order_count == 0:
-        logger.debug("No pending orders for account %s on %s", account, chain)
-        return
-
-    logger.info(
-        "Fetching %d pending order(s) for account %s on %s",
-        order_count,
-        account,
-        chain,
-    )
-
     contract_addresses = get_contract_addresses(chain)
     reader = get_reader_contract(web3, chain)
     checksum_account = to_checksum_address(account)
 
-    raw_orders: list[tuple] = reader.functions.getAccountOrders(
-        contract_addresses.datastore,
-        checksum_account,
-        0,
-        order_count,
-    ).call()
+    # The DataStore clamps the range to the order count, so we do not
+    # need a separate getBytes32Count round trip unless the page is full
+    raw_orders: list[tuple] = list(
+        reader.functions.getAccountOrders(
+            contract_addresses.datastore,
+            checksum_account,
+            0,
+            PENDING_ORDERS_PAGE_SIZE,
+        ).call()
+    )
 
-    logger.debug(
-        "Reader returned %d raw order(s) for account %s",
+    if len(raw_orders) == PENDING_ORDERS_PAGE_SIZE:
+        order_count = fetch_pending_order_count(web3, chain, account)
+        if order_count > PENDING_ORDERS_PAGE_SIZE:
+            raw_orders += reader.functions.getAccountOrders(
+                contract_addresses.datastore,
+                checksum_account,
+                PENDING_ORDERS_PAGE_SIZE,
+                order_count,
+            ).call()
+
+    if not raw_orders:
+        logger.debug("No pending orders for account %s on %s", account, chain)
+        return
+
+    logger.info(
+        "Fetched %d pending order(s) for account %s on %s",
         len(raw_orders),
         account,
+        chain,
     )
 
     for raw_order in raw_orders:
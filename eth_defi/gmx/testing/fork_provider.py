@@ -83,9 +83,14 @@ def set_code(web3: Web3, address: str, bytecode: str):
         raise Exception("Bytecode verification failed - code was not set correctly")
 
 
-def set_balance(web3: Web3, address: str, balance_hex: str):
-    """Set balance for address (works with Anvil and Tenderly)."""
-    provider_type = detect_provider_type(web3)
+def set_balance(web3: Web3, address: str, balance_hex: str, provider_type: str | None = None):
+    """Set balance for address (works with Anvil and Tenderly).
+
+    :param provider_type:
+        Result of :func:`detect_provider_type`, if the caller already has it.
+        Saves the ``anvil_nodeInfo`` round trip.
+    """
+    provider_type = provider_type or detect_provider_type(web3)
     address = to_checksum_address(address)
 
     if provider_type == "anvil":
@@ -228,9 +233,13 @@ def mine_block(web3: Web3):
             return None
 
 
-def impersonate_account(web3: Web3, address: str):
-    """Start impersonating account (works with Anvil and Tenderly)."""
-    provider_type = detect_provider_type(web3)
+def impersonate_account(web3: Web3, address: str, provider_type: str | None = None):
+    """Start impersonating account (works with Anvil and Tenderly).
+
+    :param provider_type:
+        Result of :func:`detect_provider_type`, if the caller already has it.
+    """
+    provider_type = provider_type or detect_provider_type(web3)
 
     if provider_type == "anvil":
         web3.provider.make_request("anvil_impersonateAccount", [address])
@@ -243,9 +252,13 @@ def impersonate_account(web3: Web3, address: str):
             logger.debug("Could not impersonate %s, trying to send anyway", address)
 
 
-def stop_impersonating_account(web3: Web3, address: str):
-    """Stop impersonating account (works with Anvil and Tenderly)."""
-    provider_type = detect_provider_type(web3)
+def stop_impersonating_account(web3: Web3, address: str, provider_type: str | None = None):
+    """Stop impersonating account (works with Anvil and Tenderly).
+
+    :param provider_type:
+        Result of :func:`detect_provider_type`, if the caller already has it.
+    """
+    provider_type = provider_type or detect_provider_type(web3)
 
     if provider_type == "anvil":
         web3.provider.make_request("anvil_stopImpersonatingAccount", [address])
@@ -70,15 +70,15 @@ def execute_order_as_keeper(web3: Web3, order_key: bytes):
 
     role_key = web3.keccak(encode(["string"], ["ORDER_KEEPER"]))
 
-    keeper_count = role_store.functions.getRoleMemberCount(role_key).call()
-    if keeper_count == 0:
-        raise Exception("No keepers found in RoleStore")
-
+    # RoleStore clamps the range to the member count, so an empty
+    # result means no keepers without a separate count query
     keepers = role_store.functions.getRoleMembers(role_key, 0, 1).call()
+    if not keepers:
+        raise Exception("No keepers found in RoleStore")
     keeper = keepers[0]
     logger.info("Keeper address: %s", keeper)
 
-    set_balance(web3, keeper, hex(web3.to_wei(500, "ether")))
+    set_balance(web3, keeper, hex(web3.to_wei(500, "ether")), provider_type=provider_type)
 
     order_handler_address = resolve_contract_address(chain, "orderhandler", ARBITRUM_DEFAULTS["order_handler"])
     OrderHandler = get_contract(web3, "gmx/OrderHandler.json")
@@ -98,7 +98,7 @@ def execute_order_as_keeper(web3: Web3, order_key: bytes):
         [b"", b""],
     )
 
-    impersonate_account(web3, keeper)
+    impersonate_account(web3, keeper, provider_type=provider_type)
 
     try:
         tx_hash = order_handler.functions.executeOrder(order_key, oracle_params).transact(
@@ -118,7 +118,7 @@ def execute_order_as_keeper(web3: Web3, order_key: bytes):
         return receipt, keeper
 
     finally:
-        stop_impersonating_account(web3, keeper)
+        stop_impersonating_account(web3, keeper, provider_type=provider_type)
 
 
 def extract_order_key_from_receipt(receipt: dict, web3: Web3 | None = None) -> bytes:
@@ -22,7 +22,9 @@ import logging
 import time
 from dataclasses import dataclass
 from decimal import Decimal
+from typing import Any
 
+import orjson
 import requests
 from eth_typing import HexAddress
 
@@ -80,6 +82,20 @@ DEFAULT_VAULT_DEPOSIT_RELATIVE_TOLERANCE = Decimal("0.05")
 DEFAULT_FIRST_VAULT_DEPOSIT_RELATIVE_TOLERANCE = Decimal("0.01")
 
 
+def _decode_json(response: requests.Response) -> Any:
+    """Decode a Hyperliquid API response body with orjson.
+
+    Faster than ``response.json()`` on large account state and history
+    payloads. A malformed body raises :py:class:`requests.JSONDecodeError`
+    like ``response.json()`` does, so existing ``requests`` error handling
+    keeps working.
+    """
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise requests.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
+
 class HypercoreDepositVerificationError(Exception):
     """Raised when a Hypercore vault deposit cannot be verified on HyperCore.
 
@@ -373,7 +389,7 @@ def fetch_user_vault_equities(
 
     response = session.post_info(payload, timeout=timeout)
     response.raise_for_status()
-    data = response.json()
+    data = _decode_json(response)
 
     results = []
     for entry in data:
@@ -425,7 +441,7 @@ def fetch_user_abstraction_mode(
     """
     response = session.post_info({"type": "userAbstraction", "user": user}, timeout=timeout)
     response.raise_for_status()
-    mode = response.json()
+    mode = _decode_json(response)
     assert isinstance(mode, str), f"Unexpected userAbstraction response for {user}: {mode!r}"
     return mode
 
@@ -724,6 +740,133 @@ def wait_for_vault_deposit_confirmation(
         time.sleep(min(poll_interval, remaining))
 
 
+def wait_for_vault_equity_change(
+    session: HyperliquidSession,
+    user: HexAddress | str,
+    vault_address: HexAddress | str,
+    baseline_equities: list[UserVaultEquity],
+    expected_change: Decimal,
+    timeout: float = 30.0,
+    initial_interval: float = 0.5,
+    backoff: float = 1.5,
+    max_interval: float = 2.0,
+    tolerance: Decimal = Decimal("0.01"),
+    relative_tolerance: Decimal = DEFAULT_VAULT_DEPOSIT_RELATIVE_TOLERANCE,
+) -> list[UserVaultEquity]:
+    """Wait until a vault deposit or withdrawal is reflected in the user's vault equities.
+
+    CoreWriter vault actions are processed asynchronously by HyperCore
+    after the HyperEVM transaction lands. Instead of sleeping a fixed time,
+    poll ``userVaultEquities`` with exponential backoff and return as soon
+    as the equity of *vault_address* has moved by roughly *expected_change*
+    compared to the baseline snapshot.
+
+    - **Deposit**: *expected_change* is positive. The vault position must
+      exist and its equity must have increased by at least
+      ``expected_change - max(tolerance, expected_change * relative_tolerance)``.
+    - **Withdrawal**: *expected_change* is negative. The vault equity must
+      have decreased by at least the same tolerance-adjusted amount, or the
+      position must have disappeared altogether (full withdrawal).
+
+    Equity drift of other vaults, or vault PnL smaller than the expected
+    change, does not count as the action having settled.
+
+    Example::
+
+        before = fetch_user_vault_equities(session, user=safe_address)
+        # ... broadcast the CoreWriter vaultTransfer transaction ...
+        after = wait_for_vault_equity_change(
+            session,
+            user=safe_address,
+            vault_address=HLP_VAULT_ADDRESS_MAINNET,
+            baseline_equities=before,
+            expected_change=Decimal(5),
+        )
+
+    :param session:
+        Session from :py:func:`~eth_defi.hyperliquid.session.create_hyperliquid_session`.
+
+    :param user:
+        Onchain address (the Safe address for Lagoon vaults).
+
+    :param vault_address:
+        Hypercore vault address the deposit or withdrawal targets.
+
+    :param baseline_equities:
+        Result of :py:func:`fetch_user_vault_equities` taken before the action.
+
+    :param expected_change:
+        Expected equity change in USDC (human-readable, not raw).
+        Positive for deposits, negative for withdrawals.
+
+    :param timeout:
+        Maximum seconds to wait before raising :py:class:`TimeoutError`.
+
+    :param initial_interval:
+        Seconds before the first poll.
+
+    :param backoff:
+        Multiplier applied to the interval after each poll.
+
+    :param max_interval:
+        Upper bound for the interval between polls.
+
+    :param tolerance:
+        Absolute tolerance for the equity change. Defaults to 0.01 USDC.
+
+    :param relative_tolerance:
+        Relative tolerance for the equity change. The larger of ``tolerance``
+        and ``abs(expected_change) * relative_tolerance`` is used.
+
+    :return:
+        The vault equities after the action settled.
+
+    :raises TimeoutError:
+        If the expected equity change is not observed within the timeout.
+    """
+    vault_key = vault_address.lower()
+    baseline_equity = next((eq.equity for eq in baseline_equities if eq.vault_address.lower() == vault_key), None)
+    accepted_tolerance = max(tolerance, abs(expected_change) * relative_tolerance)
+    deadline = time.time() + timeout
+    interval = initial_interval
+    attempt = 0
+
+    while True:
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            raise TimeoutError(f"Vault equity of {user} in vault {vault_address} did not change by {expected_change} USDC within {timeout}s, baseline equity: {baseline_equity}")
+
+        time.sleep(min(interval, remaining))
+        interval = min(interval * backoff, max_interval)
+        attempt += 1
+
+        equities = fetch_user_vault_equities(session, user)
+        current_equity = next((eq.equity for eq in equities if eq.vault_address.lower() == vault_key), None)
+        change = (current_equity or Decimal(0)) - (baseline_equity or Decimal(0))
+
+        if expected_change >= 0:
+            settled = current_equity is not None and change >= expected_change - accepted_tolerance
+        else:
+            # A full withdrawal removes the position from the response
+            disappeared = baseline_equity is not None and current_equity is None
+            settled = disappeared or change <= expected_change + accepted_tolerance
+
+        if settled:
+            logger.info(
+                "Vault equity of %s in vault %s settled: equity %s (change %s, expected %s, tolerance %s) after %d poll(s)",
+                user,
+                vault_address,
+                current_equity,
+                change,
+                expected_change,
+                accepted_tolerance,
+                attempt,
+            )
+            return equities
+
+        logger.debug("Vault equities of %s unchanged (poll #%d)", user, attempt)
+
+
 def fetch_spot_clearinghouse_state(
     session: HyperliquidSession,
     user: HexAddress | str,
@@ -753,7 +896,7 @@ def fetch_spot_clearinghouse_state(
 
     response = session.post_info(payload, timeout=timeout)
     response.raise_for_status()
-    data = response.json()
+    data = _decode_json(response)
 
     balances = [
         SpotBalance(
@@ -813,7 +956,7 @@ def fetch_perp_clearinghouse_state(
 
     response = session.post_info(payload, timeout=timeout)
     response.raise_for_status()
-    data = response.json()
+    data = _decode_json(response)
 
     ms = data["crossMarginSummary"]
     margin_summary = MarginSummary(
@@ -901,7 +1044,7 @@ def fetch_portfolio(
     try:
         resp = session.post_info({"type": "portfolio", "user": address}, timeout=timeout)
         resp.raise_for_status()
-        data = resp.json()
+        data = _decode_json(resp)
         # Response is array of [period, {accountValueHistory, pnlHistory, vlm}]
         periods = dict(data)
         all_time = periods.get("allTime", {})
@@ -970,7 +1113,7 @@ def fetch_vault_name(
     try:
         response = session.post_info(payload, timeout=timeout)
         response.raise_for_status()
-        data = response.json()
+        data = _decode_json(response)
         return data.get("name") or None
     except requests.RequestException:
         logger.warning("Failed to fetch vault name for %s", vault_address, exc_info=True)
@@ -1016,7 +1159,7 @@ def fetch_leaderboard(
     logger.info("Fetching leaderboard from %s", LEADERBOARD_URL)
     resp = requests.get(LEADERBOARD_URL, timeout=timeout)
     resp.raise_for_status()
-    data = resp.json()
+    data = _decode_json(resp)
     rows = data["leaderboardRows"]
     logger.info("Got %d leaderboard entries", len(rows))
 
@@ -1201,7 +1344,7 @@ def fetch_candle_snapshot(
 
     response = session.post_info(payload, timeout=timeout)
     response.raise_for_status()
-    data = response.json() or []
+    data = _decode_json(response) or []
 
     results: list[HyperliquidCandle] = []
     for entry in data:
@@ -1276,7 +1419,7 @@ def fetch_funding_history(
 
     response = session.post_info(payload, timeout=timeout)
     response.raise_for_status()
-    data = response.json() or []
+    data = _decode_json(response) or []
 
     results: list[HyperliquidFundingRate] = []
     for entry in data:
@@ -1312,4 +1455,4 @@ def fetch_perp_meta(
     """
     response = session.post_info({"type": "meta"}, timeout=timeout)
     response.raise_for_status()
-    return response.json() or {}
+    return _decode_json(response) or {}
@@ -583,10 +583,13 @@ def wait_for_evm_escrow_clear(
     poll_interval: float = 2.0,
     expected_usdc: Decimal | None = None,
     baseline_usdc: Decimal | None = None,
+    initial_delay: float | None = None,
+    backoff: float = 1.0,
+    max_poll_interval: float | None = None,
 ) -> None:
     """Wait until the user's EVM escrow is empty (all bridged funds have cleared).
 
-    Waits one ``poll_interval`` before the first check to give HyperCore
+    Waits ``initial_delay`` before the first check to give HyperCore
     time to register the escrow entry (the API can lag behind the EVM tx).
     Then polls ``spotClearinghouseState`` until ``evmEscrows`` is empty,
     indicating that all ``CoreDepositWallet.deposit()`` actions have been
@@ -621,6 +624,18 @@ def wait_for_evm_escrow_clear(
     :param poll_interval:
         Seconds between API polls. Defaults to 2 seconds.
 
+    :param initial_delay:
+        Seconds to wait before the first poll. Defaults to ``poll_interval``.
+        Keep this long enough for HyperCore to register the escrow entry
+        when using a short ``poll_interval``.
+
+    :param backoff:
+        Multiplier applied to the poll interval after each poll.
+        Defaults to ``1.0`` (fixed interval).
+
+    :param max_poll_interval:
+        Upper bound for the poll interval when ``backoff`` is used.
+
     :param expected_usdc:
         Optional expected USDC increase in the spot balance (human units,
         e.g. ``Decimal("50")`` for 50 USDC). When provided, the function
@@ -641,6 +656,9 @@ def wait_for_evm_escrow_clear(
 
     deadline = time.time() + timeout
     attempt = 0
+    interval = poll_interval
+    if max_poll_interval is None:
+        max_poll_interval = float("inf")
 
     # WARNING: The caller may already know the correct pre-phase-1 spot
     # baseline. Prefer that explicit baseline over a fresh read here.
@@ -675,7 +693,7 @@ def wait_for_evm_escrow_clear(
     # the first poll may see the pre-existing state (no escrow) and
     # return immediately, causing phase 2 to fire before the USDC
     # has actually arrived in spot.
-    time.sleep(poll_interval)
+    time.sleep(poll_interval if initial_delay is None else initial_delay)
 
     while True:
         attempt += 1
@@ -705,7 +723,8 @@ def wait_for_evm_escrow_clear(
                         baseline_usdc,
                         current_usdc,
                     )
-                    time.sleep(min(poll_interval, remaining))
+                    time.sleep(min(interval, remaining))
+                    interval = min(interval * backoff, max_poll_interval)
                     continue
                 else:
                     logger.info(
@@ -735,4 +754,5 @@ def wait_for_evm_escrow_clear(
             remaining,
             attempt,
         )
-        time.sleep(min(poll_interval, remaining))
+        time.sleep(min(interval, remaining))
+        interval = min(interval * backoff, max_poll_interval)
@@ -560,7 +560,7 @@ def validate_position_reconstruction(fills: list[Fill]) -> bool:
         actual_start = positions.get(coin, Decimal("0"))
 
         if actual_start != expected_start:
-            logger.error(f"Position mismatch for {coin} at {fill.timestamp}: expected startPosition={expected_start}, calculated={actual_start}")
+            logger.error("Position mismatch for %s at %s: expected startPosition=%s, calculated=%s", coin, fill.timestamp, expected_start, actual_start)
             return False
 
         # Update position
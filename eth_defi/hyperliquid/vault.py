@@ -540,7 +540,7 @@ def fetch_all_vaults(
     if session is None:
         session = create_hyperliquid_session()
 
-    logger.debug(f"Fetching all vaults from {stats_url}")
+    logger.debug("Fetching all vaults from %s", stats_url)
 
     # Stats-data endpoint uses GET, not POST
     response = session.get(
@@ -252,6 +252,7 @@ def assert_transaction_success_with_explanation(
     tracing: bool = False,
     func: ContractFunction = None,
     timeout: float = 120.0,
+    poll_latency: float = 0.1,
 ) -> TxReceipt:
     """Checks if a transaction succeeds and give a verbose explanation why not..
 
@@ -320,6 +321,11 @@ def assert_transaction_success_with_explanation(
     :param timeout:
         How long to wait for the transaction receipt, seconds.
 
+    :param poll_latency:
+        How often to poll for the transaction receipt, seconds.
+
+        Match this to the chain block time to avoid wasted RPC calls.
+
     :raise TransactionAssertionError:
         Outputs a verbose AssertionError on what went wrong.
 
@@ -332,7 +338,7 @@ def assert_transaction_success_with_explanation(
     else:
         assert isinstance(tx_hash, HexBytes), f"Expected HexBytes, got {type(tx_hash)}"
 
-    receipt = web3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout)
+    receipt = web3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout, poll_latency=poll_latency)
     if receipt["status"] == 0:
         # Explain why the transaction failed
         tx_details = web3.eth.get_transaction(tx_hash)
@@ -8,9 +8,10 @@ import random
 import socket
 import time
 from contextlib import contextmanager
+from functools import lru_cache, partial
 from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional, TypeVar
 from urllib.parse import urlparse
 
 import psutil
@@ -21,6 +22,15 @@ from eth_defi.coloured_logging import setup_console_logging as setup_console_log
 
 logger = logging.getLogger(__name__)
 
+#: Generic item type for :py:func:`chunked`
+T = TypeVar("T")
+
+
+#: Lowercased prefixes of non-EVM vault ids, see :py:func:`is_good_multichain_address`
+_MULTICHAIN_ID_PREFIXES = ("vlt:", "lighter-pool-", "hibachi-vault-", "apex-vault-")
+
+_MULTICHAIN_PREFIX_MAX_LENGTH = max(len(p) for p in _MULTICHAIN_ID_PREFIXES)
+
 
 def is_good_multichain_address(address: str) -> bool:
     """Check if a vault address has a recognised format.
@@ -36,16 +46,21 @@ def is_good_multichain_address(address: str) -> bool:
     :return:
         ``True`` if the address starts with a known prefix.
     """
-    addr_lower = address.lower()
-    return addr_lower.startswith("0x") or addr_lower.startswith("vlt:") or addr_lower.startswith("lighter-pool-") or addr_lower.startswith("hibachi-vault-") or addr_lower.startswith("apex-vault-")
+    # Common EVM case first, without allocating a lowercased copy
+    if address.startswith(("0x", "0X")):
+        return True
+    # Only lowercase the short head needed to match the synthetic ID prefixes
+    return address[:_MULTICHAIN_PREFIX_MAX_LENGTH].lower().startswith(_MULTICHAIN_ID_PREFIXES)
 
 
 def sanitise_string(s: str, max_length: int | None = None) -> str:
     """Remove null characters."""
     # https://stackoverflow.com/a/18762899/315168
-    fixed = s.replace("\x00", "\U0000FFFD")  # fmt: off
+    # Clean strings are the common case: a containment scan is cheaper
+    # than replace(), which always builds a new string
+    fixed = s.replace("\x00", "\U0000FFFD") if "\x00" in s else s  # fmt: off
     if max_length is not None:
-        return fixed[0:max_length]
+        return fixed[:max_length]
     return fixed
 
 
@@ -69,7 +84,7 @@ def is_localhost_port_listening(port: int, host="localhost") -> bool:
 def find_free_port(min_port: int = 20_000, max_port: int = 40_000, max_attempt: int = 20) -> int:
     """Find a free localhost port to bind.
 
-    Does by random.
+    Does by random. Candidate ports are drawn without replacement.
 
     .. note ::
 
@@ -92,8 +107,11 @@ def find_free_port(min_port: int = 20_000, max_port: int = 40_000, max_attempt:
     assert type(max_port) == int
     assert type(max_attempt) == int
 
-    for attempt in range(0, max_attempt):
-        random_port = random.randrange(start=min_port, stop=max_port)
+    # Sample all candidate ports upfront without replacement,
+    # so we never probe the same busy port twice
+    candidate_ports = random.sample(range(min_port, max_port), k=min(max_attempt, max_port - min_port))
+
+    for random_port in candidate_ports:
         logger.info("Attempting to allocate port %d to Anvil", random_port)
         if not is_localhost_port_listening(random_port, "127.0.0.1"):
             return random_port
@@ -241,11 +259,15 @@ def from_unix_timestamp(timestamp: float) -> datetime.datetime:
     return datetime.datetime.fromtimestamp(timestamp, tz=datetime.timezone.utc).replace(tzinfo=None)
 
 
+@lru_cache(maxsize=256)
 def get_url_domain(url: str) -> str:
     """Redact URL so that only domain is displayed.
 
     Some services e.g. infura use path as an API key.
 
+    The result is memoised, as the same handful of RPC URLs
+    are redacted over and over again when logging.
+
     .. note::
 
         Unlike other secrets, JSON-RPC API keys are **not** security critical:
@@ -255,6 +277,24 @@ def get_url_domain(url: str) -> str:
         prefer this redaction when logging provider URLs — but it is not an
         incident on the level of a leaked private key or database credential.
     """
+    # Fast path for plain scheme://host[:port]/... URLs, as this is called
+    # for every logged provider URL. Anything unusual goes through urlparse().
+    _, sep, rest = url.partition("://")
+    if sep:
+        netloc = rest
+        for delimiter in "/?#":
+            netloc = netloc.partition(delimiter)[0]
+        host, _, port = netloc.rpartition("@")[2].partition(":")
+        if host and not host.startswith("[") and (not port or (port.isascii() and port.isdigit())):
+            # Normalise the port like urlparse(), e.g. "0443" is 443.
+            # Out of range ports fall through so urlparse() raises its usual ValueError.
+            port_number = int(port) if port else None
+            if port_number is None or port_number <= 65535:
+                host = host.lower()
+                if port_number in (80, 443, None):
+                    return host
+                return f"{host}:{port_number}"
+
     parsed = urlparse(url)
     if parsed.port in (80, 443, None):
         return parsed.hostname
@@ -262,13 +302,37 @@ def get_url_domain(url: str) -> str:
         return f"{parsed.hostname}:{parsed.port}"
 
 
-def chunked(iterable, chunk_size):
+def chunked(iterable: Iterable[T], chunk_size: int) -> Iterator[tuple[T, ...]]:
+    """Split an iterable to fixed size chunks.
+
+    - The last chunk may be shorter than ``chunk_size``
+
+    - Chunks are returned as tuples, as callers only iterate them.
+      Wrap in ``list()`` if you need to mutate a chunk.
+
+    Example:
+
+    .. code-block:: python
+
+        assert list(chunked(range(5), 2)) == [(0, 1), (2, 3), (4,)]
+
+    :param iterable:
+        Any iterable, consumed lazily
+
+    :param chunk_size:
+        Maximum number of items per chunk
+
+    :return:
+        Iterator of chunks
+    """
     iterator = iter(iterable)  # Ensure we have an iterator
-    while True:
-        chunk = list(islice(iterator, chunk_size))
-        if not chunk:  # Break if no more items
-            break
-        yield chunk
+    # Two-argument iter() stops on the empty tuple sentinel,
+    # so the loop runs in C instead of a Python while/if
+    return iter(partial(_take_tuple, iterator, chunk_size), ())
+
+
+def _take_tuple(iterator: Iterator[T], chunk_size: int) -> tuple[T, ...]:
+    return tuple(islice(iterator, chunk_size))
 
 
 def addr(address: str | HexAddress | HexStr) -> HexAddress:
@@ -281,10 +345,11 @@ def addr(address: str | HexAddress | HexStr) -> HexAddress:
     Returns:
         HexAddress object
     """
-    if isinstance(address, (str, HexStr)):
-        return HexAddress(HexStr(address))
-    else:
-        return address
+    # HexStr and HexAddress are NewType aliases of str, so at runtime
+    # a single str check covers them and the wrap is a no-op cast
+    if isinstance(address, str):
+        return HexAddress(address)
+    return address
 
 
 @contextmanager
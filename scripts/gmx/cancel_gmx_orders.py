@@ -29,6 +29,7 @@ import logging
 import re
 import sys
 from pathlib import Path
+from typing import Iterable, Iterator
 
 from eth_account import Account
 
@@ -66,6 +67,9 @@ _ORDER_TYPE_STYLE: dict[str, str] = {
     "LIMIT_INCREASE": "bold cyan",
 }
 
+#: One order number or ``a-b`` range in the selection prompt
+_SELECTION_TOKEN_RE = re.compile(r"(\d+)(?:\s*-\s*(\d+))?")
+
 
 def _strip_json_comments(text: str) -> str:
     """Strip ``// line comments`` from a JSON-with-comments string.
@@ -82,7 +86,23 @@ def _strip_json_comments(text: str) -> str:
     :param text: Raw JSON text that may contain ``//`` line comments.
     :return: Clean JSON string with comments removed.
     """
-    return re.sub(r"^\s*//.*$", "", text, flags=re.MULTILINE)
+    return "".join(_strip_json_comment_lines(text.splitlines(keepends=True)))
+
+
+def _strip_json_comment_lines(lines: Iterable[str]) -> Iterator[str]:
+    """Blank out ``//`` full-line comments line by line.
+
+    Comment lines are replaced with an empty line, so line numbers in
+    :py:class:`json.JSONDecodeError` messages still match the file.
+
+    :param lines: JSON text lines, including their line endings.
+    :return: Lines with comment lines blanked out.
+    """
+    for line in lines:
+        if line.lstrip().startswith("//"):
+            yield "\n" if line.endswith("\n") else ""
+        else:
+            yield line
 
 
 def _load_secrets(path: Path) -> dict:
@@ -92,8 +112,9 @@ def _load_secrets(path: Path) -> dict:
     :return: Parsed secrets dictionary.
     :raises SystemExit: If the file cannot be parsed.
     """
-    raw = path.read_text()
-    clean = _strip_json_comments(raw)
+    # Filter comments while reading the file, without a whole-file regex pass
+    with path.open() as inp:
+        clean = "".join(_strip_json_comment_lines(inp))
     try:
         return json.loads(clean)
     except json.JSONDecodeError as exc:
@@ -101,11 +122,15 @@ def _load_secrets(path: Path) -> dict:
         sys.exit(1)
 
 
-def _build_orders_table(orders: list[PendingOrder]) -> Table:
+def _build_orders_table(orders: Iterable[PendingOrder]) -> tuple[Table, list[PendingOrder]]:
     """Build a Rich table displaying pending orders.
 
+    Consumes the orders in a single pass, so the
+    :py:func:`~eth_defi.gmx.order.pending_orders.fetch_pending_orders`
+    generator can be passed directly.
+
     :param orders: Pending orders to display.
-    :return: Configured Rich Table ready to print.
+    :return: Configured Rich Table ready to print, and the displayed orders in row order.
     """
     table = Table(
         box=box.ROUNDED,
@@ -124,7 +149,9 @@ def _build_orders_table(orders: list[PendingOrder]) -> Table:
     table.add_column("Dir", justify="center")
     table.add_column("Status", justify="center")
 
+    displayed = []
     for i, order in enumerate(orders, start=1):
+        displayed.append(order)
         type_style = _ORDER_TYPE_STYLE.get(order.order_type.name, "white")
         direction_text = Text("▲ long", style="green") if order.is_long else Text("▼ short", style="red")
         status_text = Text("frozen", style="yellow bold") if order.is_frozen else Text("active", style="bright_green")
@@ -139,7 +166,36 @@ def _build_orders_table(orders: list[PendingOrder]) -> Table:
             status_text,
         )
 
-    return table
+    return table, displayed
+
+
+def _parse_selection_indices(choice: str, order_count: int) -> list[int]:
+    """Parse user typed order numbers to zero-based indices.
+
+    Accepts numbers and ``a-b`` ranges separated by commas and/or
+    whitespace, e.g. ``"1, 2-4 7"``.
+
+    :param choice: Raw user input.
+    :param order_count: Number of orders shown in the table.
+    :return: Zero-based order indices in the typed order.
+    :raises ValueError: If the input has no order numbers, has unparseable
+        fragments or refers to orders outside the table.
+    """
+    tokens = _SELECTION_TOKEN_RE.findall(choice)
+    if not tokens:
+        raise ValueError("no order numbers given")
+
+    if _SELECTION_TOKEN_RE.sub("", choice).strip(" ,"):
+        raise ValueError("expected order numbers like 1,2,4-6")
+
+    indices = []
+    for start, end in tokens:
+        first = int(start)
+        last = int(end) if end else first
+        if not 1 <= first <= last <= order_count:
+            raise ValueError(f"order numbers must be between 1 and {order_count}")
+        indices.extend(range(first - 1, last))
+    return indices
 
 
 def _prompt_selection(orders: list[PendingOrder]) -> list[PendingOrder]:
@@ -151,7 +207,7 @@ def _prompt_selection(orders: list[PendingOrder]) -> list[PendingOrder]:
     console.print()
     console.print(
         Panel(
-            "[dim]  [bold white]all[/bold white]       – cancel every order\n  [bold white]sl[/bold white]        – cancel [bold red]stop-loss[/bold red] orders only\n  [bold white]tp[/bold white]        – cancel [bold green]take-profit[/bold green] orders only\n  [bold white]1,2,3[/bold white]     – cancel specific orders by number\n  [bold white]q[/bold white] / Enter – quit without cancelling[/dim]",
+            "[dim]  [bold white]all[/bold white]       – cancel every order\n  [bold white]sl[/bold white]        – cancel [bold red]stop-loss[/bold red] orders only\n  [bold white]tp[/bold white]        – cancel [bold green]take-profit[/bold green] orders only\n  [bold white]1,2,4-6[/bold white]   – cancel specific orders by number or range\n  [bold white]q[/bold white] / Enter – quit without cancelling[/dim]",
             title="[bold]Select orders to cancel[/bold]",
             border_style="bright_black",
             expand=False,
@@ -179,11 +235,11 @@ def _prompt_selection(orders: list[PendingOrder]) -> list[PendingOrder]:
             console.print("[yellow]No take-profit orders in the list.[/yellow]")
         return selected
 
-    # Comma-separated indices
+    # Order numbers and ranges, separated by commas and/or spaces
     try:
-        indices = [int(x.strip()) - 1 for x in choice.split(",")]
+        indices = _parse_selection_indices(choice, len(orders))
         return [orders[i] for i in indices]
-    except (ValueError, IndexError) as exc:
+    except ValueError as exc:
         console.print(f"[bold red]Invalid selection '{choice}': {exc}[/bold red]")
         sys.exit(1)
 
@@ -238,16 +294,17 @@ def main() -> None:
         )
     )
 
-    # Fetch pending orders from GMX DataStore
+    # Fetch pending orders from GMX DataStore. The Reader returns all orders
+    # in one eth_call, so decode them straight into the table in one pass.
     logger.info("Fetching pending orders from GMX DataStore…")
-    orders: list[PendingOrder] = list(fetch_pending_orders(web3, chain, wallet_address))
+    orders_table, orders = _build_orders_table(fetch_pending_orders(web3, chain, wallet_address))
 
     if not orders:
         console.print("\n[yellow]No pending cancellable orders found for this wallet.[/yellow]")
         return
 
     console.print()
-    console.print(_build_orders_table(orders))
+    console.print(orders_table)
 
     # Interactive selection
     selected = _prompt_selection(orders)
@@ -38,6 +38,9 @@ Environment Variables
 - ``ARBITRUM_SEPOLIA_RPC_URL``: Arbitrum Sepolia JSON-RPC endpoint (required).
 - ``TRIGGER_PRICE_USD``: Override the trigger price in USD (optional).
   If not set, the price is computed as 10 % above the current oracle spot price.
+- ``TX_POLL_LATENCY``: Transaction receipt polling interval in seconds (optional, default 0.25).
+- ``QUIET``: Set to ``1`` to skip the order parameter dumps (optional).
+  They are also skipped when stdout is not a terminal.
 
 See Also
 --------
@@ -51,16 +54,12 @@ import logging
 import os
 import sys
 
-from rich.console import Console
-from rich.logging import RichHandler
-
 from eth_defi.chain import get_chain_name
 from eth_defi.gmx.ccxt.exchange import GMX
-from eth_defi.hotwallet import HotWallet
 from eth_defi.trace import assert_transaction_success_with_explanation
-from scripts.gmx.script_utils import fetch_eth_spot_price
+from scripts.gmx.script_utils import TX_POLL_LATENCY, WETH_PRICE_DIVISOR, console, extract_order_keys, fetch_eth_spot_price_raw, is_verbose_output, read_script_credentials, strip_nonce
 
-console = Console()
+logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
 # Defaults
@@ -73,53 +72,22 @@ LEVERAGE = 2.0
 SLIPPAGE_PERCENT = 0.005
 EXECUTION_BUFFER = 30
 
-#: Event topic hash for ``OrderCreated(bytes32,OrderProps)``
-ORDER_CREATED_TOPIC = "a7427759bfd3b941f14e687e129519da3c9b0046c5b9aaa290bb1dede63753b3"
-
 
-def _extract_order_keys(receipt: dict) -> list[bytes]:
-    """Return the order keys emitted by ``OrderCreated`` events in *receipt*.
+def _index_orders_by_id(orders: list[dict]) -> dict[str, dict]:
+    """Index CCXT orders by lowercased ``id``.
 
-    :param receipt:
-        Transaction receipt dict from ``web3.eth.wait_for_transaction_receipt``.
-    :return:
-        List of 32-byte order keys found in the receipt.
+    Pending GMX orders use the hex order key as their id. Lowercasing
+    makes the lookup independent of the hex case the id was formatted with.
     """
-    keys: list[bytes] = []
-    for log in receipt.get("logs", []):
-        topics = log.get("topics", [])
-        if len(topics) < 3:
-            continue
-        topic_hashes = []
-        for topic in topics:
-            if isinstance(topic, bytes):
-                topic_hashes.append(topic.hex())
-            elif isinstance(topic, str):
-                topic_hashes.append(topic.removeprefix("0x"))
-            else:
-                topic_hashes.append(topic.hex())
-        if len(topic_hashes) >= 3 and topic_hashes[1] == ORDER_CREATED_TOPIC:
-            keys.append(bytes.fromhex(topic_hashes[2]))
-    return keys
+    return {(o.get("id") or "").lower(): o for o in orders}
 
 
 def main():
-    FORMAT = "%(message)s"
-    logging.basicConfig(level="INFO", format=FORMAT, datefmt="[%X]", handlers=[RichHandler()])
-    logging.getLogger("eth_defi").setLevel(logging.INFO)
-
-    rpc_url = os.environ.get("ARBITRUM_SEPOLIA_RPC_URL")
-    private_key = os.environ.get("PRIVATE_KEY")
+    # GMX builds its own connection from rpcUrl, so do not open a second one here
+    rpc_url, wallet = read_script_credentials()
+    verbose = is_verbose_output()
     trigger_price_override = os.environ.get("TRIGGER_PRICE_USD")
 
-    if not rpc_url:
-        console.print("[red]Error: ARBITRUM_SEPOLIA_RPC_URL environment variable not set[/red]")
-        sys.exit(1)
-
-    if not private_key:
-        console.print("[red]Error: PRIVATE_KEY environment variable not set[/red]")
-        sys.exit(1)
-
     console.print("\n[bold green]=== GMX CCXT Limit Order + Cancel — Arbitrum Sepolia ===[/bold green]\n")
 
     # ------------------------------------------------------------------
@@ -127,8 +95,6 @@ def main():
     # ------------------------------------------------------------------
     console.print("[bold cyan]Step 1 — Connect via CCXT GMX exchange[/bold cyan]")
 
-    wallet = HotWallet.from_private_key(private_key)
-
     gmx = GMX(
         params={
             "rpcUrl": rpc_url,
@@ -162,8 +128,10 @@ def main():
         console.print(f"  Using manual trigger: ${trigger_price_usd:,.2f} (from TRIGGER_PRICE_USD env var)")
     else:
         try:
-            spot_price = fetch_eth_spot_price(chain)
-            trigger_price_usd = spot_price * 1.10
+            spot_price_raw = fetch_eth_spot_price_raw(chain)
+            # Integer maths for the +10 % premium, convert to float only once
+            spot_price = spot_price_raw / WETH_PRICE_DIVISOR
+            trigger_price_usd = (spot_price_raw * 11 // 10) / WETH_PRICE_DIVISOR
             console.print(f"  Oracle spot price:    ${spot_price:,.2f}")
             console.print(f"  Trigger (+10 %):      ${trigger_price_usd:,.2f}")
         except Exception as exc:
@@ -182,11 +150,12 @@ def main():
     # Setting trigger 10 % above spot keeps the order pending during our test.
     #
     console.print(f"\n[bold cyan]Step 3 — Create short limit order[/bold cyan]")
-    console.print(f"  Market:        ETH (short)")
-    console.print(f"  Collateral:    {COLLATERAL_SYMBOL}")
-    console.print(f"  Size:          ${SIZE_USD}")
-    console.print(f"  Leverage:      {LEVERAGE}x")
-    console.print(f"  Trigger price: ${trigger_price_usd:,.2f}  (10 % above spot — stays pending)")
+    if verbose:
+        console.print(f"  Market:        ETH (short)")
+        console.print(f"  Collateral:    {COLLATERAL_SYMBOL}")
+        console.print(f"  Size:          ${SIZE_USD}")
+        console.print(f"  Leverage:      {LEVERAGE}x")
+        console.print(f"  Trigger price: ${trigger_price_usd:,.2f}  (10 % above spot — stays pending)")
 
     order_result = gmx.trader.open_limit_position(
         market_symbol="ETH",
@@ -202,46 +171,42 @@ def main():
 
     console.print(f"  Execution fee: {order_result.execution_fee / 10**18:.6f} ETH")
 
-    transaction = dict(order_result.transaction)
-    if "nonce" in transaction:
-        del transaction["nonce"]
-
-    signed_tx = gmx.wallet.sign_transaction_with_new_nonce(transaction)
+    signed_tx = gmx.wallet.sign_transaction_with_new_nonce(strip_nonce(order_result.transaction))
     tx_hash = gmx.web3.eth.send_raw_transaction(signed_tx.rawTransaction)
-    console.print(f"  TX: [yellow]{tx_hash.hex()}[/yellow]")
+    logger.info("Create TX: %s", tx_hash.hex())
 
-    assert_transaction_success_with_explanation(gmx.web3, tx_hash)
-    receipt = gmx.web3.eth.wait_for_transaction_receipt(tx_hash)
+    receipt = assert_transaction_success_with_explanation(gmx.web3, tx_hash, poll_latency=TX_POLL_LATENCY)
     console.print(f"  Confirmed in block {receipt['blockNumber']}.")
 
-    order_keys = _extract_order_keys(receipt)
+    order_keys = extract_order_keys(receipt)
     if not order_keys:
         console.print("[red]No OrderCreated event found in receipt — cannot determine order key.[/red]")
         sys.exit(1)
 
     order_key_bytes = order_keys[0]
+    # bytes.hex() is lowercase, matching the keys of _index_orders_by_id()
     order_key_hex = "0x" + order_key_bytes.hex()
-    console.print(f"  [green]Order key: {order_key_hex}[/green]")
+    logger.info("Order key: %s", order_key_hex)
 
     # ------------------------------------------------------------------
     # Step 4: Verify via CCXT fetch_orders
     # ------------------------------------------------------------------
     console.print(f"\n[bold cyan]Step 4 — Verify via CCXT fetch_orders()[/bold cyan]")
 
-    pending = gmx.fetch_orders(symbol=MARKET_SYMBOL)
+    pending_by_id = _index_orders_by_id(gmx.fetch_orders(symbol=MARKET_SYMBOL))
+    order_info = pending_by_id.get(order_key_hex)
 
-    matching = [o for o in pending if o.get("id") == order_key_hex]
-    if not matching:
+    if order_info is None:
         console.print("[yellow]Order not found in fetch_orders() — it may have already executed.[/yellow]")
         sys.exit(0)
 
-    order_info = matching[0]
-    console.print(f"  Found pending order via CCXT:")
-    console.print(f"    id:     {order_info['id'][:26]}…")
-    console.print(f"    type:   {order_info.get('type')}")
-    console.print(f"    side:   {order_info.get('side')}")
-    console.print(f"    price:  ${order_info.get('price', 0):,.2f}")
-    console.print(f"    status: {order_info.get('status')}")
+    if verbose:
+        console.print(f"  Found pending order via CCXT:")
+        console.print(f"    id:     {order_info['id'][:26]}…")
+        console.print(f"    type:   {order_info.get('type')}")
+        console.print(f"    side:   {order_info.get('side')}")
+        console.print(f"    price:  ${order_info.get('price', 0):,.2f}")
+        console.print(f"    status: {order_info.get('status')}")
 
     # ------------------------------------------------------------------
     # Step 5: Cancel via CCXT cancel_order
@@ -253,7 +218,7 @@ def main():
     assert cancel_result.get("status") == "cancelled", f"Expected status='cancelled', got {cancel_result.get('status')!r}"
 
     cancel_tx_hash = cancel_result["info"].get("tx_hash", "unknown")
-    console.print(f"  Cancel TX: [yellow]{cancel_tx_hash}[/yellow]")
+    logger.info("Cancel TX: %s", cancel_tx_hash)
     console.print(f"  Status:    [green]{cancel_result['status']}[/green]")
 
     # ------------------------------------------------------------------
@@ -261,10 +226,9 @@ def main():
     # ------------------------------------------------------------------
     console.print(f"\n[bold cyan]Step 6 — Confirm cancellation via CCXT fetch_orders()[/bold cyan]")
 
-    pending_after = gmx.fetch_orders(symbol=MARKET_SYMBOL)
-    still_there = [o for o in pending_after if o.get("id") == order_key_hex]
+    pending_after_by_id = _index_orders_by_id(gmx.fetch_orders(symbol=MARKET_SYMBOL))
 
-    if still_there:
+    if order_key_hex in pending_after_by_id:
         console.print("[red]Order still appears in fetch_orders() — cancellation may have failed.[/red]")
         sys.exit(1)
 
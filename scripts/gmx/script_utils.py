@@ -8,38 +8,360 @@ Provides helpers that are used across multiple scripts to avoid duplication.
     is on the Python path), e.g. ``poetry run python scripts/gmx/my_script.py``.
 """
 
-from eth_defi.gmx.contracts import get_token_address_normalized
+import logging
+import os
+import sys
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+
+from eth_abi import encode
+from eth_typing import HexAddress
+from rich.console import Console
+from rich.logging import RichHandler
+from web3 import Web3
+
+from eth_defi.chain import get_chain_name
+from eth_defi.event_reader.multicall_batcher import get_multicall_contract
+from eth_defi.gmx.contracts import ContractAddresses, get_contract_addresses, get_tokens_address_dict, normalize_gmx_token_symbol
 from eth_defi.gmx.core.oracle import OraclePrices
+from eth_defi.hotwallet import HotWallet
+from eth_defi.provider.multi_provider import create_multi_provider_web3
+from eth_defi.token import TokenDetails
 
 #: Canonical WETH address on Arbitrum One — used as fallback when the oracle
 #: does not return a token address for the configured chain.
 WETH_MAINNET_ARBITRUM = "0x82aF49447D8a07e3bd95BD0d56f35241523fBab1"
 
+_WETH_MAINNET_ARBITRUM_LOWER = WETH_MAINNET_ARBITRUM.lower()
 
-def fetch_eth_spot_price(chain: str) -> float:
-    """Fetch current ETH spot price from the GMX oracle API.
+#: GMX oracle WETH prices are USD × 10^12 (30-decimal precision minus 18 WETH decimals)
+WETH_PRICE_DIVISOR = 10**12
+
+#: How long :func:`fetch_eth_spot_price` reuses a fetched price, in seconds.
+#: Override with the ``GMX_ORACLE_TTL`` environment variable.
+SPOT_PRICE_CACHE_TTL_SECONDS = float(os.environ.get("GMX_ORACLE_TTL", "2.0"))
+
+#: Event topic hash for ``OrderCreated(bytes32,OrderProps)``.
+#:
+#: GMX V2 emits order events through ``EventEmitter.EventLog2``, with the
+#: event name hash in ``topics[1]`` and the order key in ``topics[2]``.
+ORDER_CREATED_TOPIC = "a7427759bfd3b941f14e687e129519da3c9b0046c5b9aaa290bb1dede63753b3"
+
+#: :data:`ORDER_CREATED_TOPIC` as raw bytes, compared directly against log topics
+ORDER_CREATED_TOPIC_BYTES = bytes.fromhex(ORDER_CREATED_TOPIC)
+
+#: Function selector of ERC-20 ``approve(address,uint256)``
+ERC20_APPROVE_SELECTOR = bytes.fromhex("095ea7b3")
+
+#: How often the example scripts poll for transaction receipts, in seconds.
+#: Arbitrum blocks land every ~250 ms, so polling faster only wastes RPC calls.
+#: Override with the ``TX_POLL_LATENCY`` environment variable.
+TX_POLL_LATENCY = float(os.environ.get("TX_POLL_LATENCY", "0.25"))
+
+console = Console()
+
+#: Cached raw spot prices: chain -> (monotonic fetch time, maxPriceFull)
+_spot_price_cache: dict[str, tuple[float, int]] = {}
+
+
+def clear_spot_price_cache() -> None:
+    """Drop cached spot prices.
+
+    Call this to force :func:`fetch_eth_spot_price_raw` to query the oracle again.
+    """
+    _spot_price_cache.clear()
+
+
+def _normalise_topic(topic: bytes | str) -> bytes:
+    """Convert a log topic to raw bytes."""
+    if isinstance(topic, bytes):
+        return topic
+    return bytes.fromhex(topic.removeprefix("0x"))
+
+
+def _is_order_created_topic(topic: bytes | str) -> bool:
+    """Compare an event name topic against :data:`ORDER_CREATED_TOPIC` without converting it."""
+    if isinstance(topic, bytes):
+        return topic == ORDER_CREATED_TOPIC_BYTES
+    return topic.removeprefix("0x").lower() == ORDER_CREATED_TOPIC
+
+
+def extract_order_keys(receipt: dict) -> list[bytes]:
+    """Return the order keys emitted by ``OrderCreated`` events in *receipt*.
+
+    Topics may be raw bytes (web3.py receipts) or hex strings (raw JSON-RPC
+    receipts). Only the order key topic of matching logs is converted.
+
+    :param receipt:
+        Transaction receipt dict from ``web3.eth.wait_for_transaction_receipt``.
+    :return:
+        List of 32-byte order keys found in the receipt.
+    """
+    keys: list[bytes] = []
+    for log in receipt.get("logs", ()):
+        topics = log.get("topics") or ()
+        if len(topics) >= 3 and _is_order_created_topic(topics[1]):
+            keys.append(bytes(_normalise_topic(topics[2])))
+    return keys
+
+
+def strip_nonce(tx: dict) -> dict:
+    """Copy an unsigned transaction without its ``nonce`` field.
+
+    GMX order builders fill in a nonce, but
+    :py:meth:`~eth_defi.hotwallet.HotWallet.sign_transaction_with_new_nonce`
+    allocates its own.
+
+    :param tx: Unsigned transaction.
+    :return: A new dict with the same fields except ``nonce``.
+    """
+    return {k: v for k, v in tx.items() if k != "nonce"}
+
+
+@lru_cache(maxsize=16)
+def encode_approve_calldata(spender: HexAddress, amount: int) -> str:
+    """ABI-encode an ERC-20 ``approve(spender, amount)`` call.
+
+    Memoised for the lifetime of the process, so repeated approvals of the
+    same spender and amount within one script run are encoded once.
+
+    :param spender: Address allowed to spend the tokens.
+    :param amount: Allowance in raw token units.
+    :return: 0x-prefixed calldata.
+    """
+    return "0x" + (ERC20_APPROVE_SELECTOR + encode(["address", "uint256"], [spender, amount])).hex()
+
+
+@lru_cache(maxsize=16)
+def _get_tokens_address_dict_cached(chain: str) -> dict[str, str]:
+    return get_tokens_address_dict(chain)
+
+
+def get_token_address_cached(chain: str, symbol: str) -> str | None:
+    """Memoised :func:`~eth_defi.gmx.contracts.get_token_address_normalized`.
+
+    The GMX token list is fetched over HTTP once per chain and kept for
+    the process lifetime, so looking up several symbols costs one request.
+
+    :param chain: GMX chain name, e.g. ``"arbitrum"``.
+    :param symbol: Token symbol, ETH/WETH and AVAX/WAVAX are normalised.
+    :return: Token address or ``None`` if GMX does not list the symbol.
+    """
+    return _get_tokens_address_dict_cached(chain).get(normalize_gmx_token_symbol(chain, symbol))
+
+
+@lru_cache(maxsize=16)
+def get_contract_addresses_cached(chain: str) -> ContractAddresses:
+    """Memoised :func:`~eth_defi.gmx.contracts.get_contract_addresses`.
+
+    Cached for the process lifetime, which is fine for short-lived scripts
+    but bypasses the remote release refresh TTL.
+
+    :param chain: GMX chain name.
+    :return: GMX contract addresses for the chain.
+    """
+    return get_contract_addresses(chain)
+
+
+def fetch_eth_spot_price_raw(chain: str) -> int:
+    """Fetch current ETH spot price from the GMX oracle API as a raw integer.
 
     For Arbitrum Sepolia the oracle uses mainnet prices since the testnet
     does not have its own oracle.
 
+    The price is cached per chain for :data:`SPOT_PRICE_CACHE_TTL_SECONDS`,
+    see :func:`clear_spot_price_cache`.
+
+    Use integer maths on the result, e.g. ``raw * 11 // 10`` for a 10 % premium,
+    and divide by :data:`WETH_PRICE_DIVISOR` only at the end to avoid
+    float rounding.
+
     :param chain: GMX chain name, e.g. ``"arbitrum"`` or ``"arbitrum_sepolia"``.
-    :returns: Current ETH price in USD as a float.
+    :returns: ``maxPriceFull`` of WETH, USD × 10^12.
     :raises RuntimeError: If the oracle API cannot be reached or ETH price is not found.
     """
+    cached = _spot_price_cache.get(chain)
+    if cached is not None and time.monotonic() - cached[0] < SPOT_PRICE_CACHE_TTL_SECONDS:
+        return cached[1]
+
     oracle = OraclePrices(chain)
-    weth_address = get_token_address_normalized(chain, "WETH") or WETH_MAINNET_ARBITRUM
+    weth_address = get_token_address_cached(chain, "WETH") or WETH_MAINNET_ARBITRUM
+    # get_price_for_token() handles the testnet -> mainnet address translation
+    # and shares the oracle module price cache, so the fallback below does not
+    # trigger a second HTTP request
     price_data = oracle.get_price_for_token(weth_address)
 
     if price_data is None:
-        # Fallback: iterate all returned prices looking for the known WETH address
+        # Fallback: look up the known mainnet WETH address, case-insensitively
         all_prices = oracle.get_recent_prices()
-        for addr, data in all_prices.items():
-            if addr.lower() == WETH_MAINNET_ARBITRUM.lower():
-                price_data = data
-                break
+        price_data = all_prices.get(WETH_MAINNET_ARBITRUM)
+        if price_data is None:
+            prices_by_lower_address = {address.lower(): data for address, data in all_prices.items()}
+            price_data = prices_by_lower_address.get(_WETH_MAINNET_ARBITRUM_LOWER)
 
     if price_data is None:
         raise RuntimeError(f"Could not find ETH/WETH price in GMX oracle response for chain '{chain}'")
 
+    raw_price = int(price_data["maxPriceFull"])
+    _spot_price_cache[chain] = (time.monotonic(), raw_price)
+    return raw_price
+
+
+def fetch_eth_spot_price(chain: str) -> float:
+    """Fetch current ETH spot price from the GMX oracle API.
+
+    Float wrapper around :func:`fetch_eth_spot_price_raw` for display.
+
+    :param chain: GMX chain name, e.g. ``"arbitrum"`` or ``"arbitrum_sepolia"``.
+    :returns: Current ETH price in USD as a float.
+    :raises RuntimeError: If the oracle API cannot be reached or ETH price is not found.
+    """
     # GMX stores WETH price as USD × 10^12 (30-decimal precision, WETH has 18 decimals)
-    return int(price_data["maxPriceFull"]) / 10**12
+    return fetch_eth_spot_price_raw(chain) / WETH_PRICE_DIVISOR
+
+
+@dataclass(slots=True, frozen=True)
+class WalletTokenState:
+    """Wallet balances needed before opening a GMX order."""
+
+    #: Native ETH balance in wei
+    eth_balance: int
+
+    #: Collateral token balance in raw token units
+    token_balance: int
+
+    #: Collateral token allowance for the spender in raw token units
+    allowance: int
+
+
+def fetch_wallet_token_state(
+    web3: Web3,
+    wallet_address: HexAddress,
+    token: TokenDetails,
+    spender: HexAddress,
+) -> WalletTokenState:
+    """Read ETH balance, token balance and token allowance in one RPC call.
+
+    The three reads are bundled into a single Multicall3 ``aggregate3``
+    ``eth_call`` instead of three sequential round trips.
+
+    :param web3: Web3 connection.
+    :param wallet_address: Wallet whose balances are read.
+    :param token: Collateral token.
+    :param spender: Contract the allowance is given to, e.g. GMX SyntheticsRouter.
+    :return: Balances at the latest block.
+    """
+    multicall = get_multicall_contract(web3)
+    calldatas = [
+        multicall.encode_abi(abi_element_identifier="getEthBalance", args=[wallet_address]),
+        token.contract.encode_abi(abi_element_identifier="balanceOf", args=[wallet_address]),
+        token.contract.encode_abi(abi_element_identifier="allowance", args=[wallet_address, spender]),
+    ]
+    targets = [multicall.address, token.address, token.address]
+    calls = [(target, False, bytes.fromhex(data[2:])) for target, data in zip(targets, calldatas)]
+    results = multicall.functions.aggregate3(calls).call()
+    eth_balance, token_balance, allowance = (int.from_bytes(return_data, "big") for _success, return_data in results)
+    return WalletTokenState(eth_balance=eth_balance, token_balance=token_balance, allowance=allowance)
+
+
+@dataclass(slots=True, frozen=True)
+class ScriptEnv:
+    """Connection and wallet shared by the GMX example scripts."""
+
+    #: Connection built from the RPC environment variable
+    web3: Web3
+
+    #: Signer built from the private key environment variable
+    wallet: HotWallet
+
+    #: GMX chain name, e.g. ``"arbitrum_sepolia"``
+    chain: str
+
+    #: Chain id reported by the RPC
+    chain_id: int
+
+    #: Print cosmetic parameter dumps.
+    #:
+    #: ``False`` when stdout is not a terminal, e.g. in CI, or ``QUIET=1`` is set.
+    verbose: bool
+
+
+def read_script_credentials(
+    rpc_env: str = "ARBITRUM_SEPOLIA_RPC_URL",
+    pk_env: str = "PRIVATE_KEY",
+) -> tuple[str, HotWallet]:
+    """Set up logging and read the RPC URL and hot wallet for a script.
+
+    Does not connect to the RPC, for scripts that build their own connection,
+    e.g. through the CCXT GMX exchange.
+
+    Exits the process with an error message if an environment variable is missing.
+
+    :param rpc_env: Environment variable holding the JSON-RPC URL.
+    :param pk_env: Environment variable holding the wallet private key.
+    :return: Tuple ``(rpc_url, wallet)``. The wallet nonce is not synced.
+    """
+    logging.basicConfig(level="INFO", format="%(message)s", datefmt="[%X]", handlers=[RichHandler()])
+    logging.getLogger("eth_defi").setLevel(logging.INFO)
+
+    rpc_url = os.environ.get(rpc_env)
+    private_key = os.environ.get(pk_env)
+
+    if not rpc_url:
+        console.print(f"[red]Error: {rpc_env} environment variable not set[/red]")
+        sys.exit(1)
+
+    if not private_key:
+        console.print(f"[red]Error: {pk_env} environment variable not set[/red]")
+        sys.exit(1)
+
+    return rpc_url, HotWallet.from_private_key(private_key)
+
+
+def is_verbose_output() -> bool:
+    """Whether to print cosmetic parameter dumps.
+
+    :return: ``False`` when stdout is not a terminal, e.g. in CI, or ``QUIET=1`` is set.
+    """
+    return console.is_terminal and os.environ.get("QUIET") != "1"
+
+
+def setup_script_env(
+    rpc_env: str = "ARBITRUM_SEPOLIA_RPC_URL",
+    pk_env: str = "PRIVATE_KEY",
+    sync_nonce: bool = True,
+) -> ScriptEnv:
+    """Set up logging, the RPC connection and the hot wallet for a script.
+
+    Exits the process with an error message if an environment variable is missing
+    or the RPC cannot be reached.
+
+    :param rpc_env: Environment variable holding the JSON-RPC URL.
+    :param pk_env: Environment variable holding the wallet private key.
+    :param sync_nonce:
+        Read the wallet nonce before returning.
+
+        Pass ``False`` if the caller syncs the nonce itself,
+        e.g. overlapped with other reads.
+    :return: Script connection and wallet.
+    """
+    rpc_url, wallet = read_script_credentials(rpc_env, pk_env)
+    web3 = create_multi_provider_web3(rpc_url)
+
+    try:
+        chain_id = web3.eth.chain_id
+    except Exception as exc:
+        console.print(f"[red]Failed to connect: {exc}[/red]")
+        sys.exit(1)
+
+    if sync_nonce:
+        wallet.sync_nonce(web3)
+
+    return ScriptEnv(
+        web3=web3,
+        wallet=wallet,
+        chain=get_chain_name(chain_id).lower(),
+        chain_id=chain_id,
+        verbose=is_verbose_output(),
+    )
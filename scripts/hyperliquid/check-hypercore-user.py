@@ -7,7 +7,9 @@ Environment variables
 ---------------------
 - ``ADDRESS``: HyperCore user address to query (required).
 - ``NETWORK``: ``mainnet`` (default) or ``testnet``.
-- ``LOG_LEVEL``: Logging level (default: ``info``).
+- ``LOG_LEVEL``: Logging level (default: ``warning``).
+- ``OUTPUT``: ``table`` (default) for human-readable tables, or ``json`` / ``ndjson``
+  for one JSON object per line per section, for dashboards and other tools.
 
 Usage::
 
@@ -17,12 +19,22 @@ Usage::
     NETWORK=testnet ADDRESS=0xAbc... poetry run python scripts/hyperliquid/check-hypercore-user.py
 """
 
+import io
 import logging
 import os
+import sys
+from dataclasses import dataclass
 
+import orjson
+from eth_typing import HexAddress
+from eth_utils import is_address, to_checksum_address
+from joblib import Parallel, delayed
 from tabulate import tabulate
 
 from eth_defi.hyperliquid.api import (
+    PerpClearinghouseState,
+    SpotClearinghouseState,
+    UserVaultEquity,
     fetch_perp_clearinghouse_state,
     fetch_spot_clearinghouse_state,
     fetch_user_vault_equities,
@@ -36,75 +48,162 @@ from eth_defi.utils import setup_console_logging
 
 logger = logging.getLogger(__name__)
 
+#: Number formatters for the output tables
+_FMT2 = "{:,.2f}".format
+_FMT4 = "{:,.4f}".format
+_FMT6 = "{:,.6f}".format
+
+
+@dataclass(slots=True, frozen=True)
+class ScriptConfig:
+    """Script settings, read once from the environment."""
+
+    #: Checksummed HyperCore user address
+    address: HexAddress
+
+    #: ``mainnet`` or ``testnet``
+    network: str
+
+    #: Hyperliquid API base URL for the network
+    api_url: str
+
+    #: ``table``, ``json`` or ``ndjson``
+    output_format: str
+
+    @classmethod
+    def from_environment(cls) -> "ScriptConfig":
+        """Parse and validate the environment variables.
+
+        :raise AssertionError: On a missing or invalid variable.
+        """
+        env = os.environ
+
+        address = env.get("ADDRESS")
+        assert address, "ADDRESS environment variable required"
+        # Fail before any API call on a typo, instead of getting empty account data back
+        assert is_address(address), f"ADDRESS is not a valid address: {address}"
+
+        network = env.get("NETWORK", "mainnet").lower()
+        assert network in ("mainnet", "testnet"), f"NETWORK must be 'mainnet' or 'testnet', got '{network}'"
+
+        output_format = env.get("OUTPUT", "table").lower()
+        assert output_format in ("table", "json", "ndjson"), f"OUTPUT must be 'table', 'json' or 'ndjson', got '{output_format}'"
+
+        return cls(
+            address=to_checksum_address(address),
+            network=network,
+            api_url=HYPERLIQUID_TESTNET_API_URL if network == "testnet" else HYPERLIQUID_API_URL,
+            output_format=output_format,
+        )
+
+
+def _write_ndjson(
+    spot: SpotClearinghouseState,
+    perp: PerpClearinghouseState,
+    equities: list[UserVaultEquity],
+) -> None:
+    """Write the account state to stdout as newline-delimited JSON.
+
+    One ``{"section": ..., "rows": [...]}`` object per line. Decimals are
+    written as strings to keep their precision.
+    """
+    sections = {
+        "spot_balances": spot.balances,
+        "evm_escrows": spot.evm_escrows,
+        "perp_account": [{"margin_summary": perp.margin_summary, "withdrawable": perp.withdrawable}],
+        "perp_positions": perp.asset_positions,
+        "vault_positions": equities,
+    }
+    out = sys.stdout.buffer
+    for section, rows in sections.items():
+        out.write(orjson.dumps({"section": section, "rows": rows}, default=str))
+        out.write(b"\n")
+    out.flush()
+
 
 def main():
-    log_level = os.environ.get("LOG_LEVEL", "info")
-    setup_console_logging(default_log_level=log_level)
+    # The report is printed anyway, so the fetch functions' info logs are only noise by default
+    setup_console_logging(default_log_level="warning")
 
-    address = os.environ.get("ADDRESS")
-    assert address, "ADDRESS environment variable required"
+    config = ScriptConfig.from_environment()
 
-    network = os.environ.get("NETWORK", "mainnet").lower()
-    assert network in ("mainnet", "testnet"), f"NETWORK must be 'mainnet' or 'testnet', got '{network}'"
+    if config.output_format == "table":
+        print(f"HyperCore user: {config.address}")
+        print(f"Network: {config.network}")
+        print(f"API: {config.api_url}")
 
-    api_url = HYPERLIQUID_TESTNET_API_URL if network == "testnet" else HYPERLIQUID_API_URL
+    session = create_hyperliquid_session(api_url=config.api_url, requests_per_second=2.75)
 
-    print(f"HyperCore user: {address}")
-    print(f"Network: {network}")
-    print(f"API: {api_url}")
+    # The three info queries are independent, so issue them concurrently
+    spot, perp, equities = Parallel(n_jobs=3, backend="threading")(
+        delayed(fetch_func)(session, user=config.address)
+        for fetch_func in (
+            fetch_spot_clearinghouse_state,
+            fetch_perp_clearinghouse_state,
+            fetch_user_vault_equities,
+        )
+    )
 
-    session = create_hyperliquid_session(api_url=api_url)
+    if config.output_format != "table":
+        _write_ndjson(spot, perp, equities)
+        return
+
+    # Collect the report and write it out at once, instead of one write per line
+    out = io.StringIO()
 
     # Spot balances
-    spot = fetch_spot_clearinghouse_state(session, user=address)
     if spot.balances:
-        rows = [[b.coin, f"{b.total:,.6f}", f"{b.hold:,.6f}"] for b in spot.balances]
-        print("\nSpot balances:")
-        print(tabulate(rows, headers=["Token", "Total", "Hold"], tablefmt="simple"))
+        rows = [(b.coin, _FMT6(b.total), _FMT6(b.hold)) for b in spot.balances]
+        print("\nSpot balances:", file=out)
+        print(tabulate(rows, headers=["Token", "Total", "Hold"], tablefmt="simple"), file=out)
     else:
-        print("\nSpot balances: none")
+        print("\nSpot balances: none", file=out)
 
     if spot.evm_escrows:
-        rows = [[e.coin, f"{e.total:,.6f}"] for e in spot.evm_escrows]
-        print("\nEVM escrows (bridged, pending HyperCore processing):")
-        print(tabulate(rows, headers=["Token", "Amount"], tablefmt="simple"))
+        rows = [(e.coin, _FMT6(e.total)) for e in spot.evm_escrows]
+        print("\nEVM escrows (bridged, pending HyperCore processing):", file=out)
+        print(tabulate(rows, headers=["Token", "Amount"], tablefmt="simple"), file=out)
 
-    # Perpetual account
-    perp = fetch_perp_clearinghouse_state(session, user=address)
+    # Perpetual account, fresh accounts have nothing worth tabulating
     ms = perp.margin_summary
-    perp_rows = [
-        ["Account value", f"{ms.account_value:,.2f} USDC"],
-        ["Total notional position", f"{ms.total_ntl_pos:,.2f} USDC"],
-        ["Raw USD balance", f"{ms.total_raw_usd:,.2f} USDC"],
-        ["Margin used", f"{ms.total_margin_used:,.2f} USDC"],
-        ["Withdrawable", f"{perp.withdrawable:,.2f} USDC"],
-    ]
-    print("\nPerp account:")
-    print(tabulate(perp_rows, tablefmt="simple"))
-
-    if perp.asset_positions:
-        rows = [
-            [
-                p.coin,
-                f"{p.size:,.4f}",
-                f"{p.entry_price:,.2f}" if p.entry_price else "-",
-                f"{p.position_value:,.2f}",
-                f"{p.unrealised_pnl:,.2f}",
-                f"{p.liquidation_price:,.2f}" if p.liquidation_price else "-",
-            ]
-            for p in perp.asset_positions
+    if ms.account_value == 0 and not perp.asset_positions:
+        print("\nPerp account: empty", file=out)
+    else:
+        perp_rows = [
+            ("Account value", f"{_FMT2(ms.account_value)} USDC"),
+            ("Total notional position", f"{_FMT2(ms.total_ntl_pos)} USDC"),
+            ("Raw USD balance", f"{_FMT2(ms.total_raw_usd)} USDC"),
+            ("Margin used", f"{_FMT2(ms.total_margin_used)} USDC"),
+            ("Withdrawable", f"{_FMT2(perp.withdrawable)} USDC"),
         ]
-        print("\nPerp positions:")
-        print(tabulate(rows, headers=["Coin", "Size", "Entry", "Value", "PnL", "Liq price"], tablefmt="simple"))
+        print("\nPerp account:", file=out)
+        print(tabulate(perp_rows, tablefmt="simple"), file=out)
+
+        if perp.asset_positions:
+            rows = [
+                (
+                    p.coin,
+                    _FMT4(p.size),
+                    _FMT2(p.entry_price) if p.entry_price else "-",
+                    _FMT2(p.position_value),
+                    _FMT2(p.unrealised_pnl),
+                    _FMT2(p.liquidation_price) if p.liquidation_price else "-",
+                )
+                for p in perp.asset_positions
+            ]
+            print("\nPerp positions:", file=out)
+            print(tabulate(rows, headers=["Coin", "Size", "Entry", "Value", "PnL", "Liq price"], tablefmt="simple"), file=out)
 
     # Vault positions
-    equities = fetch_user_vault_equities(session, user=address)
     if equities:
-        rows = [[eq.vault_address, f"{eq.equity:,.6f}", eq.locked_until.isoformat()] for eq in equities]
-        print("\nVault positions:")
-        print(tabulate(rows, headers=["Vault", "Equity (USDC)", "Locked until (UTC)"], tablefmt="simple"))
+        rows = [(eq.vault_address, _FMT6(eq.equity), eq.locked_until.isoformat()) for eq in equities]
+        print("\nVault positions:", file=out)
+        print(tabulate(rows, headers=["Vault", "Equity (USDC)", "Locked until (UTC)"], tablefmt="simple"), file=out)
     else:
-        print("\nVault positions: none")
+        print("\nVault positions: none", file=out)
+
+    sys.stdout.write(out.getvalue())
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -67,6 +67,9 @@ Environment variables
 - ``DEPOSIT_MODE``: ``two_phase`` (default) or ``batched``.
   ``two_phase`` splits bridge and vault deposit with an escrow wait;
   ``batched`` uses a single multicall but can silently fail under load.
+- ``NONCE_RESYNC``: Set to ``true`` to wait and re-read the deployer nonce
+  from the RPC after deployment. Only needed with RPCs that lag behind
+  (default: unset).
 - ``LOG_LEVEL``: Logging level (default: ``info``)
 
 Reconnecting to an existing deployment:
@@ -122,32 +125,36 @@ Common issues:
 For more information see `README-Hypercore-guard.md`.
 """
 
+import json
 import logging
 import os
-import random
+import tempfile
 import time
 from decimal import Decimal
+from pathlib import Path
 
 from eth_account import Account
-from eth_typing import HexAddress, HexStr
+from eth_typing import ChecksumAddress
 from safe_eth.safe.safe import Safe
 from tabulate import tabulate
 from web3 import Web3
 
 from eth_defi.erc_4626.vault_protocol.lagoon.deployment import LAGOON_BEACON_PROXY_FACTORIES, LagoonConfig, LagoonDeploymentParameters, deploy_automated_lagoon_vault
 from eth_defi.erc_4626.vault_protocol.lagoon.vault import LagoonVault
+from eth_defi.event_reader.multicall_batcher import MULTICALL_DEPLOY_ADDRESS, get_multicall_contract
 from eth_defi.gas import estimate_gas_price
 from eth_defi.hotwallet import HotWallet
-from eth_defi.hyperliquid.api import fetch_user_vault_equities
+from eth_defi.hyperliquid.api import UserVaultEquity, fetch_user_vault_equities, wait_for_vault_equity_change
+from eth_defi.hyperliquid.constants import HLP_VAULT_ADDRESS_MAINNET, HLP_VAULT_ADDRESS_TESTNET
 from eth_defi.hyperliquid.core_writer import build_hypercore_deposit_multicall, build_hypercore_deposit_phase1, build_hypercore_deposit_phase2, build_hypercore_withdraw_multicall
 from eth_defi.hyperliquid.evm_escrow import DEFAULT_ACTIVATION_AMOUNT, activate_account, is_account_activated, wait_for_evm_escrow_clear
-from eth_defi.hyperliquid.session import HYPERLIQUID_API_URL, HYPERLIQUID_TESTNET_API_URL, create_hyperliquid_session
+from eth_defi.hyperliquid.session import HYPERLIQUID_API_URL, HYPERLIQUID_TESTNET_API_URL, HyperliquidSession, create_hyperliquid_session
 from eth_defi.hyperliquid.testing import setup_anvil_hypercore_mocks
 from eth_defi.provider.anvil import ANVIL_PRIVATE_KEY, fork_network_anvil, fund_erc20_on_anvil
 from eth_defi.provider.multi_provider import create_multi_provider_web3
 from eth_defi.safe.execute import execute_safe_tx
 from eth_defi.safe.safe_compat import create_safe_ethereum_client
-from eth_defi.token import USDC_NATIVE_TOKEN, fetch_erc20_details
+from eth_defi.token import USDC_NATIVE_TOKEN, TokenDetails, TokenDiskCache, fetch_erc20_details
 from eth_defi.trace import TransactionAssertionError, assert_transaction_success_with_explanation
 from eth_defi.utils import setup_console_logging
 from eth_defi.vault.base import VaultSpec
@@ -155,24 +162,94 @@ from eth_defi.vault.base import VaultSpec
 logger = logging.getLogger(__name__)
 
 #: Default Hypercore vault address per network (HLP on each network)
-DEFAULT_VAULTS = {
-    "testnet": "0xa15099a30bbf2e68942d6f4c43d70d04faeab0a0",
-    "mainnet": "0xdfc24b077bc1425ad1dea75bcb6f8158e10df303",
+DEFAULT_VAULTS: dict[str, ChecksumAddress] = {
+    "testnet": Web3.to_checksum_address(HLP_VAULT_ADDRESS_TESTNET),
+    "mainnet": Web3.to_checksum_address(HLP_VAULT_ADDRESS_MAINNET),
 }
 
 #: Default public RPC for HyperEVM testnet
 HYPERLIQUID_TESTNET_RPC = "https://rpc.hyperliquid-testnet.xyz/evm"
 
+#: Addresses known to be activated on HyperCore, one JSON file per chain.
+#: Activation cannot be undone, so only positive results are stored.
+ACTIVATED_ACCOUNTS_CACHE_DIR = Path("~/.tradingstrategy/hyperliquid/activated-accounts").expanduser()
+
+
+def _fetch_balances(
+    web3: Web3,
+    usdc: TokenDetails,
+    addresses: list[ChecksumAddress],
+) -> list[tuple[int, int]]:
+    """Read native HYPE and USDC balances of several addresses in one RPC call.
+
+    All reads are bundled into a single Multicall3 ``aggregate3`` ``eth_call``
+    instead of two sequential round trips per address. HyperEVM uses the
+    canonical Multicall3 address, so we pass it explicitly and skip the
+    ``eth_chainId`` lookups :py:func:`get_multicall_contract` would do.
+
+    :return:
+        ``(hype_wei, usdc_raw)`` per address, in the order given.
+    """
+    multicall = get_multicall_contract(web3, address=MULTICALL_DEPLOY_ADDRESS)
+    calls = []
+    for address in addresses:
+        calls.append((multicall.address, False, bytes.fromhex(multicall.encode_abi(abi_element_identifier="getEthBalance", args=[address])[2:])))
+        calls.append((usdc.address, False, bytes.fromhex(usdc.contract.encode_abi(abi_element_identifier="balanceOf", args=[address])[2:])))
+    results = multicall.functions.aggregate3(calls).call()
+    values = [int.from_bytes(return_data, "big") for _success, return_data in results]
+    return list(zip(values[0::2], values[1::2]))
+
+
+def _read_activated_safes(chain_id: int) -> set[str]:
+    """Read the on-disk cache of Safes known to be activated on HyperCore.
+
+    A missing, unreadable or corrupted cache file is treated as a cache miss.
+    """
+    path = ACTIVATED_ACCOUNTS_CACHE_DIR / f"{chain_id}.json"
+    if not path.exists():
+        return set()
+
+    try:
+        return {address.lower() for address in json.loads(path.read_text())}
+    except (json.JSONDecodeError, OSError) as e:
+        logger.warning("Ignoring unreadable activated accounts cache %s: %s", path, e)
+        return set()
+
+
+def _mark_safe_activated(chain_id: int, safe_address: str):
+    """Remember a Safe is activated on HyperCore for later runs.
+
+    Written through a temporary file and ``os.replace()`` so an interrupted
+    run never leaves a half-written cache file behind.
+    """
+    path = ACTIVATED_ACCOUNTS_CACHE_DIR / f"{chain_id}.json"
+    activated = _read_activated_safes(chain_id)
+    activated.add(safe_address.lower())
+    ACTIVATED_ACCOUNTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=ACTIVATED_ACCOUNTS_CACHE_DIR, prefix=f".{path.name}.", suffix=".tmp")
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "w") as out:
+            out.write(json.dumps(sorted(activated)))
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
 
 def _print_hypercore_balances(
     safe_address: str,
-    network: str,
+    session: HyperliquidSession | None,
     simulate: bool,
+    equities: list[UserVaultEquity] | None = None,
 ) -> list:
     """Query Hyperliquid info API and print the Safe's Hypercore vault balances.
 
     Skipped in SIMULATE mode (Anvil mocks CoreWriter, no real Hypercore state).
 
+    :param equities:
+        Already fetched vault equities. If given, the info API is not queried again.
+
     :return:
         List of :py:class:`~eth_defi.hyperliquid.api.UserVaultEquity` positions,
         or empty list in simulate mode.
@@ -181,9 +258,9 @@ def _print_hypercore_balances(
         logger.info("Skipping Hypercore balance check in SIMULATE mode")
         return []
 
-    api_url = HYPERLIQUID_TESTNET_API_URL if network == "testnet" else HYPERLIQUID_API_URL
-    session = create_hyperliquid_session(api_url=api_url)
-    equities = fetch_user_vault_equities(session, user=safe_address)
+    if equities is None:
+        equities = fetch_user_vault_equities(session, user=safe_address)
+
     if equities:
         rows = [[eq.vault_address, f"{eq.equity:,.6f}", eq.locked_until.isoformat()] for eq in equities]
         print("\nHypercore vault balances (Safe):")
@@ -194,6 +271,40 @@ def _print_hypercore_balances(
     return equities
 
 
+def _wait_for_corewriter_settle(
+    session: HyperliquidSession | None,
+    safe_address: str,
+    vault_address: str,
+    equities_before: list[UserVaultEquity],
+    expected_change: Decimal,
+    simulate: bool,
+) -> list[UserVaultEquity] | None:
+    """Wait for queued CoreWriter actions to show up in the Safe's vault equities.
+
+    :param expected_change:
+        Expected vault equity change in USDC, negative for withdrawals.
+
+    :return:
+        Settled vault equities, or ``None`` in simulate mode or on timeout,
+        in which case balances are refetched for printing.
+    """
+    if simulate:
+        return None
+
+    logger.info("Waiting for CoreWriter actions to settle on HyperCore...")
+    try:
+        return wait_for_vault_equity_change(
+            session,
+            user=safe_address,
+            vault_address=vault_address,
+            baseline_equities=equities_before,
+            expected_change=expected_change,
+        )
+    except TimeoutError as e:
+        logger.warning("%s, checking balances anyway", e)
+        return None
+
+
 def _do_deposit(
     lagoon_vault,
     usdc_amount: int,
@@ -201,7 +312,7 @@ def _do_deposit(
     vault_address: str,
     deployer: HotWallet,
     usdc_human: int,
-    network: str,
+    session: HyperliquidSession | None,
     simulate: bool,
     deposit_mode: str = "batched",
     activation_amount: int = DEFAULT_ACTIVATION_AMOUNT,
@@ -220,23 +331,27 @@ def _do_deposit(
     """
     web3 = lagoon_vault.web3
 
-    # Build session with the correct API URL for escrow polling
-    api_url = HYPERLIQUID_TESTNET_API_URL if network == "testnet" else HYPERLIQUID_API_URL
-    session = create_hyperliquid_session(api_url=api_url) if not simulate else None
-
     # On live networks, ensure the Safe is activated on HyperCore
     if not simulate:
-        if not is_account_activated(web3, user=lagoon_vault.safe_address):
-            logger.info("Safe %s not activated on HyperCore, activating...", lagoon_vault.safe_address)
-            activate_account(
-                web3=web3,
-                lagoon_vault=lagoon_vault,
-                deployer=deployer,
-                session=session,
-                activation_amount=activation_amount,
-                timeout=activation_timeout,
-            )
-            deployer.sync_nonce(web3)
+        # Reruns against an existing deployment (``LAGOON_VAULT``) hit the
+        # on-disk cache instead of issuing the ``coreUserExists`` ``eth_call``
+        if lagoon_vault.safe_address.lower() in _read_activated_safes(lagoon_vault.chain_id):
+            logger.info("Safe %s known to be activated on HyperCore (cached)", lagoon_vault.safe_address)
+        else:
+            if not is_account_activated(web3, user=lagoon_vault.safe_address):
+                logger.info("Safe %s not activated on HyperCore, activating...", lagoon_vault.safe_address)
+                activate_account(
+                    web3=web3,
+                    lagoon_vault=lagoon_vault,
+                    deployer=deployer,
+                    session=session,
+                    activation_amount=activation_amount,
+                    timeout=activation_timeout,
+                )
+            _mark_safe_activated(lagoon_vault.chain_id, lagoon_vault.safe_address)
+
+    # Snapshot vault positions so we can detect when CoreWriter actions land
+    equities_before = fetch_user_vault_equities(session, user=lagoon_vault.safe_address) if not simulate else []
 
     if not simulate:
         assert deposit_mode != "batched", "Batched deposit mode is disabled on live networks. The batched multicall puts all 4 steps (approve, CDW.deposit, transferUsdClass, vaultTransfer) into a single EVM block. Steps 3-4 are CoreWriter actions that depend on the CDW bridge (step 2) having cleared the EVM escrow, but because they land in the same block, HyperCore may process the CoreWriter actions before the bridge clears — causing steps 3-4 to silently fail while the EVM transaction succeeds. The USDC ends up stuck in spot or perp with no vault position. Use DEPOSIT_MODE=two_phase (default) which waits for the escrow to clear between the bridge and the CoreWriter actions."
@@ -270,6 +385,7 @@ def _do_deposit(
         ]
         print("\nDeposit results:")
         print(tabulate(deposit_results, tablefmt="simple"))
+        settled_equities = _wait_for_corewriter_settle(session, lagoon_vault.safe_address, vault_address, equities_before, Decimal(usdc_human), simulate)
 
     elif deposit_mode == "two_phase":
         # Two-phase deposit: bridge first, wait for escrow, then batch
@@ -287,11 +403,19 @@ def _do_deposit(
 
         # Wait for EVM escrow to clear
         logger.info("Waiting for EVM escrow to clear...")
-        wait_for_evm_escrow_clear(session, user=lagoon_vault.safe_address)
+        # Keep the default 2s grace period for HyperCore to register the
+        # escrow, then poll quickly so phase 2 starts as soon as it clears.
+        wait_for_evm_escrow_clear(
+            session,
+            user=lagoon_vault.safe_address,
+            initial_delay=2.0,
+            poll_interval=0.25,
+            backoff=1.3,
+            max_poll_interval=1.0,
+        )
 
         # Phase 2: move USDC from spot to perp and deposit into vault
         logger.info("Phase 2: transferUsdClass + vaultTransfer...")
-        deployer.sync_nonce(web3)
         fn2 = build_hypercore_deposit_phase2(
             lagoon_vault=lagoon_vault,
             hypercore_usdc_amount=hypercore_amount,
@@ -311,16 +435,14 @@ def _do_deposit(
         print("\nDeposit results:")
         print(tabulate(deposit_results, tablefmt="simple"))
 
+        # CoreWriter actions are asynchronous: the EVM transaction only queues
+        # the action, and HyperCore processes it with a few seconds delay.
+        settled_equities = _wait_for_corewriter_settle(session, lagoon_vault.safe_address, vault_address, equities_before, Decimal(usdc_human), simulate)
+
     else:
         raise ValueError(f"Unknown deposit mode: {deposit_mode!r} (expected 'batched' or 'two_phase')")
 
-    # CoreWriter actions are asynchronous: the EVM transaction only queues
-    # the action, and HyperCore processes it with a few seconds delay.
-    # Wait before checking balances so the deposit has time to land.
-    if not simulate:
-        logger.info("Waiting 10s for CoreWriter actions to settle on HyperCore...")
-        time.sleep(10)
-    equities = _print_hypercore_balances(lagoon_vault.safe_address, network, simulate)
+    equities = _print_hypercore_balances(lagoon_vault.safe_address, session, simulate, equities=settled_equities)
     if not simulate:
         assert len(equities) > 0, f"Deposit failed: Safe {lagoon_vault.safe_address} has no vault positions on HyperCore after deposit"
 
@@ -331,11 +453,18 @@ def _do_withdraw(
     vault_address: str,
     deployer: HotWallet,
     usdc_human: int,
-    network: str,
+    session: HyperliquidSession | None,
     simulate: bool,
+    usdc_token: TokenDetails,
 ):
-    """Execute withdrawal via multicall."""
+    """Execute withdrawal via multicall.
+
+    :param usdc_token:
+        The vault underlying USDC, already resolved in :py:func:`main`.
+    """
     web3 = lagoon_vault.web3
+    equities_before = fetch_user_vault_equities(session, user=lagoon_vault.safe_address) if not simulate else []
+
     logger.info("Executing multicall withdrawal (%d USDC)...", usdc_human)
     fn = build_hypercore_withdraw_multicall(
         lagoon_vault=lagoon_vault,
@@ -347,6 +476,7 @@ def _do_withdraw(
             tx_hash = fn.transact({"from": deployer.address})
         else:
             tx_hash = deployer.transact_and_broadcast_with_contract(fn)
+
         receipt = assert_transaction_success_with_explanation(web3, tx_hash)
         withdraw_results = [
             ["Transaction", tx_hash.hex()],
@@ -356,6 +486,10 @@ def _do_withdraw(
         ]
         print("\nWithdrawal results:")
         print(tabulate(withdraw_results, tablefmt="simple"))
+
+        # CoreWriter actions are asynchronous: the EVM transaction only queues
+        # the action, and HyperCore processes it with a few seconds delay.
+        settled_equities = _wait_for_corewriter_settle(session, lagoon_vault.safe_address, vault_address, equities_before, -Decimal(usdc_human), simulate)
     except (TransactionAssertionError, Exception) as e:
         logger.warning(
             "Withdrawal failed (expected if vault has lock-up period): %s",
@@ -364,26 +498,16 @@ def _do_withdraw(
         print(f"\nWithdrawal skipped: {str(e)[:200]}")
         return
 
-    # CoreWriter actions are asynchronous: the EVM transaction only queues
-    # the action, and HyperCore processes it with a few seconds delay.
-    # Wait before checking balances so the withdrawal has time to settle.
-    if not simulate:
-        logger.info("Waiting 10s for CoreWriter actions to settle on HyperCore...")
-        time.sleep(10)
-    _print_hypercore_balances(lagoon_vault.safe_address, network, simulate)
+    _print_hypercore_balances(lagoon_vault.safe_address, session, simulate, equities=settled_equities)
 
     # Transfer remaining USDC from Safe back to deployer via Safe
     # multisig execTransaction (bypasses the guard, which would block
     # performCall transfers to non-whitelisted receivers).
-    usdc_token = lagoon_vault.underlying_token
-    safe_balance = usdc_token.fetch_balance_of(lagoon_vault.safe_address)
-    if safe_balance > 0:
-        logger.info("Transferring %s USDC from Safe back to deployer %s", safe_balance, deployer.address)
-        raw_amount = usdc_token.convert_to_raw(safe_balance)
-        transfer_data = usdc_token.contract.functions.transfer(
-            deployer.address,
-            raw_amount,
-        ).build_transaction({"from": lagoon_vault.safe_address})["data"]
+    raw_amount = usdc_token.contract.functions.balanceOf(Web3.to_checksum_address(lagoon_vault.safe_address)).call()
+    if raw_amount > 0:
+        logger.info("Transferring %s USDC from Safe back to deployer %s", usdc_token.convert_to_decimals(raw_amount), deployer.address)
+        # Encode locally, build_transaction() would estimate gas and fetch gas prices only to discard them
+        transfer_data = usdc_token.contract.encode_abi(abi_element_identifier="transfer", args=[deployer.address, raw_amount])
 
         if simulate:
             # In Anvil simulate mode, impersonate the Safe and call the
@@ -409,7 +533,6 @@ def _do_withdraw(
             )
             safe_tx.sign(deployer.private_key.hex())
             gas_estimate = estimate_gas_price(web3)
-            deployer.sync_nonce(web3)
             tx_hash, _tx = execute_safe_tx(
                 safe_tx,
                 tx_sender_private_key=deployer.private_key.hex(),
@@ -441,7 +564,8 @@ def main():
     private_key = os.environ.get("HYPERCORE_WRITER_TEST_PRIVATE_KEY", ANVIL_PRIVATE_KEY if simulate else None)
     assert private_key, "HYPERCORE_WRITER_TEST_PRIVATE_KEY environment variable required (or set SIMULATE=true)"
 
-    vault_address = HexAddress(HexStr(os.environ.get("HYPERCORE_VAULT", DEFAULT_VAULTS[network])))
+    hypercore_vault = os.environ.get("HYPERCORE_VAULT")
+    vault_address = Web3.to_checksum_address(hypercore_vault) if hypercore_vault else DEFAULT_VAULTS[network]
     # Minimum vault deposit is 5 USDC
     usdc_human = int(os.environ.get("USDC_AMOUNT", "5"))
     deposit_mode = os.environ.get("DEPOSIT_MODE", "two_phase").lower()
@@ -451,6 +575,9 @@ def main():
     activation_human = int(os.environ.get("ACTIVATION_AMOUNT", "2"))
     activation_timeout = float(os.environ.get("ACTIVATION_TIMEOUT", "60"))
 
+    # All transactions go through the HotWallet nonce counter, set to re-read the nonce after deployment
+    nonce_resync = os.environ.get("NONCE_RESYNC", "").lower() in ("1", "true", "yes")
+
     # Existing deployment addresses (skip deploy + whitelist when set)
     existing_lagoon_vault = os.environ.get("LAGOON_VAULT")
     existing_module = os.environ.get("TRADING_STRATEGY_MODULE")
@@ -471,6 +598,12 @@ def main():
         logger.info("Live %s mode (RPC: %s)", network, json_rpc)
         web3 = create_multi_provider_web3(json_rpc, default_http_timeout=(3, 500.0))
 
+    # One info API session for the whole run, so escrow polling, equity polling
+    # and balance printing share the same connection pool and rate limiter.
+    # Anvil mocks CoreWriter, so there is no HyperCore state to query in simulate mode.
+    api_url = HYPERLIQUID_TESTNET_API_URL if network == "testnet" else HYPERLIQUID_API_URL
+    hl_session = create_hyperliquid_session(api_url=api_url) if not simulate else None
+
     chain_id = web3.eth.chain_id
     logger.info("Connected to chain %d, block %d", chain_id, web3.eth.block_number)
 
@@ -480,7 +613,8 @@ def main():
     logger.info("Deployer: %s", deployer.address)
 
     usdc_address = USDC_NATIVE_TOKEN[chain_id]
-    usdc = fetch_erc20_details(web3, usdc_address)
+    # Token metadata is static, read it from the disk cache when we have seen it before
+    usdc = fetch_erc20_details(web3, usdc_address, chain_id=chain_id, cache=TokenDiskCache())
     usdc_amount = usdc.convert_to_raw(usdc_human)
     hypercore_amount = usdc_amount  # Hypercore uses same decimals as EVM USDC
 
@@ -491,21 +625,20 @@ def main():
     total_safe_funding_raw = usdc_amount + activation_raw
     total_safe_funding_human = usdc_human + (activation_raw / 10**6)
 
+    # Track HYPE (gas) usage across all phases
+    [(hype_start, deployer_usdc_raw)] = _fetch_balances(web3, usdc, [deployer_account.address])
+
     # Check deployer has enough HYPE (gas) and USDC before doing anything expensive
     if not simulate:
-        hype_balance = web3.eth.get_balance(deployer_account.address)
-        hype_human = hype_balance / 10**18
+        hype_human = hype_start / 10**18
         min_hype = 0.1
         assert hype_human >= min_hype, f"Deployer {deployer_account.address} has {hype_human:.4f} HYPE, need at least {min_hype} HYPE for gas"
 
-        deployer_usdc_human = usdc.fetch_balance_of(deployer_account.address)
+        deployer_usdc_human = usdc.convert_to_decimals(deployer_usdc_raw)
         min_usdc = total_safe_funding_human
         assert deployer_usdc_human >= min_usdc, f"Deployer {deployer_account.address} has {deployer_usdc_human:.2f} USDC, need at least {min_usdc:.0f} USDC ({usdc_human} deposit + {activation_human:.0f} activation)"
         logger.info("Deployer balances: %.4f HYPE, %.2f USDC", hype_human, deployer_usdc_human)
 
-    # Track HYPE (gas) usage across all phases
-    hype_start = web3.eth.get_balance(deployer_account.address)
-
     if existing_lagoon_vault:
         # Reconnect to an existing Lagoon deployment
         logger.info("Reconnecting to existing deployment: vault=%s module=%s", existing_lagoon_vault, existing_module)
@@ -515,7 +648,7 @@ def main():
             trading_strategy_module_address=existing_module,
             default_block_identifier="latest",
         )
-        safe_address = lagoon_vault.safe_address
+        safe_address = Web3.to_checksum_address(lagoon_vault.safe_address)
         module = lagoon_vault.trading_strategy_module
         logger.info("Vault:  %s", lagoon_vault.vault_address)
         logger.info("Safe:   %s", safe_address)
@@ -546,7 +679,8 @@ def main():
             safe_threshold=1,
             any_asset=False,
             hypercore_vaults=[vault_address],
-            safe_salt_nonce=random.randint(0, 1000) if not from_the_scratch else None,
+            # Nanosecond timestamp: unique per run, unlike a small random range that collides on reruns
+            safe_salt_nonce=time.time_ns() if not from_the_scratch else None,
             from_the_scratch=from_the_scratch,
             use_forge=from_the_scratch,  # Required for from_the_scratch
             between_contracts_delay_seconds=8.0,  # Speed up deployment by waiting less
@@ -574,10 +708,11 @@ def main():
         if simulate:
             fund_erc20_on_anvil(web3, usdc_address, safe_address, usdc_amount)
         else:
-            # Wait for RPC nodes to catch up with the latest nonce after
-            # deployment, then sync HotWallet's internal nonce counter
-            time.sleep(2)
-            deployer.sync_nonce(web3)
+            # deploy_automated_lagoon_vault() already re-syncs the nonce after
+            # deployment. Only re-read it again for RPCs known to lag behind.
+            if nonce_resync:
+                time.sleep(2)
+                deployer.sync_nonce(web3)
 
             # Transfer USDC from deployer to Safe on live network.
             # Includes activation overhead (2 USDC) so the Safe has enough
@@ -599,7 +734,8 @@ def main():
                 assert_transaction_success_with_explanation(web3, tx_hash)
                 logger.info("USDC transfer to Safe complete: tx %s", tx_hash.hex())
 
-    balance = usdc.fetch_balance_of(safe_address)
+    balance_raw = usdc.contract.functions.balanceOf(safe_address).call()
+    balance = usdc.convert_to_decimals(balance_raw)
     logger.info("Safe USDC balance: %s", balance)
 
     # In SIMULATE mode, impersonate the deployer so eth_sendTransaction works
@@ -608,7 +744,6 @@ def main():
         web3.provider.make_request("anvil_impersonateAccount", [deployer_account.address])
 
     if action in ("deposit", "both"):
-        balance_raw = usdc.contract.functions.balanceOf(Web3.to_checksum_address(safe_address)).call()
         assert balance_raw >= total_safe_funding_raw, f"Safe USDC balance {balance} ({balance_raw} raw) insufficient, need {total_safe_funding_human} ({total_safe_funding_raw} raw): {usdc_human} deposit + {activation_human} activation"
         _do_deposit(
             lagoon_vault,
@@ -617,7 +752,7 @@ def main():
             vault_address,
             deployer,
             usdc_human,
-            network=network,
+            session=hl_session,
             simulate=bool(simulate),
             deposit_mode=deposit_mode,
             activation_amount=activation_raw,
@@ -631,17 +766,18 @@ def main():
             vault_address,
             deployer,
             usdc_human,
-            network=network,
+            session=hl_session,
             simulate=bool(simulate),
+            usdc_token=usdc,
         )
 
     if simulate:
         web3.provider.make_request("anvil_stopImpersonatingAccount", [deployer_account.address])
 
     # Summary
-    hype_end = web3.eth.get_balance(deployer_account.address)
+    (hype_end, _), (_, final_balance_raw) = _fetch_balances(web3, usdc, [deployer_account.address, safe_address])
     total_hype_spent = (hype_start - hype_end) / 10**18
-    final_balance = usdc.fetch_balance_of(safe_address)
+    final_balance = usdc.convert_to_decimals(final_balance_raw)
     summary = [
         ["Network", network],
         ["Vault", lagoon_vault.vault_address],
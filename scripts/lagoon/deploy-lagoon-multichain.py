@@ -46,6 +46,10 @@ Environment variables
     Amount of USDC to bridge per destination chain.
     Defaults to ``0.1``.
 
+``MAX_WORKERS``
+    Maximum number of threads for parallel per-chain and per-vault RPC work.
+    Defaults to ``16``.
+
 ``JSON_RPC_ARBITRUM``
     Arbitrum One RPC URL (mainnet mode).
 
@@ -134,16 +138,17 @@ import logging
 import os
 import random
 import threading
-import time
-from copy import deepcopy
+from dataclasses import replace
 from decimal import Decimal
-from typing import cast
+from typing import Callable, cast
 
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
 from eth_typing import HexAddress
+from joblib import Parallel, delayed
 from web3 import Web3
 
+from eth_defi.abi import encode_multicalls
 from eth_defi.cctp.bridge import CCTPBridgeDestination, bridge_usdc_cctp_parallel
 from eth_defi.cctp.constants import CHAIN_ID_TO_CCTP_DOMAIN, TESTNET_CHAIN_ID_TO_CCTP_DOMAIN
 from eth_defi.cctp.testing import replace_attester_on_fork
@@ -151,12 +156,13 @@ from eth_defi.cctp.whitelist import CCTPDeployment
 from eth_defi.erc_4626.classification import create_vault_instance, detect_vault_features
 from eth_defi.erc_4626.vault import ERC4626Vault
 from eth_defi.erc_4626.vault_protocol.lagoon.config_event_scanner import build_multichain_guard_config, fetch_guard_config_events, format_guard_config_report
-from eth_defi.erc_4626.vault_protocol.lagoon.deployment import LagoonConfig, LagoonDeploymentParameters, LagoonMultichainDeployment, deploy_multichain_lagoon_vault
+from eth_defi.erc_4626.vault_protocol.lagoon.deployment import LagoonAutomatedDeployment, LagoonConfig, LagoonDeploymentParameters, LagoonMultichainDeployment, deploy_multichain_lagoon_vault
 from eth_defi.erc_4626.vault_protocol.lagoon.testing import fund_lagoon_vault
+from eth_defi.event_reader.multicall_batcher import MULTICALL_DEPLOY_ADDRESS, get_multicall_contract
 from eth_defi.hotwallet import HotWallet
 from eth_defi.provider.anvil import AnvilLaunch, fork_network_anvil, fund_erc20_on_anvil
 from eth_defi.provider.multi_provider import create_multi_provider_web3
-from eth_defi.token import USDC_NATIVE_TOKEN, USDC_WHALE, WRAPPED_NATIVE_TOKEN, fetch_erc20_details
+from eth_defi.token import USDC_NATIVE_TOKEN, USDC_WHALE, WRAPPED_NATIVE_TOKEN, TokenDiskCache, fetch_erc20_details
 from eth_defi.trace import assert_transaction_success_with_explanation
 from eth_defi.uniswap_v3.constants import UNISWAP_V3_DEPLOYMENTS
 from eth_defi.uniswap_v3.deployment import fetch_deployment as fetch_deployment_uni_v3
@@ -253,6 +259,10 @@ TESTNET_CHAIN_ID_MAP: dict[str, int] = {
     "base_sepolia": 84532,
 }
 
+#: All known chain names to chain IDs. Connections are checked against this
+#: on setup, so later code can look chain IDs up without an ``eth_chainId`` call.
+CHAIN_ID_MAP: dict[str, int] = MAINNET_CHAIN_ID_MAP | TESTNET_CHAIN_ID_MAP
+
 #: Default chain ordering. First chain is the source vault (deposit/redeem entry point).
 MAINNET_DEFAULT_CHAINS: list[str] = ["arbitrum", "ethereum", "base", "hyperliquid", "monad"]
 TESTNET_DEFAULT_CHAINS: list[str] = ["arbitrum_sepolia", "base_sepolia"]
@@ -286,35 +296,60 @@ MAINNET_CHAIN_FEATURES: dict[str, dict] = {
 }
 
 
-def resolve_vaults(web3: Web3, vault_addresses: list[str]) -> list[ERC4626Vault]:
-    """Resolve ERC-4626 vault addresses into vault instances.
+def _run_threaded(func: Callable, args_list: list[tuple], max_workers: int) -> list:
+    """Call ``func(*args)`` for each argument tuple using joblib threads.
+
+    :param max_workers:
+        Upper bound for the number of threads.
 
-    Detects vault features and creates proper vault instances
-    for whitelisting during deployment.
+    :return:
+        Results in the input order.
+    """
+    if not args_list:
+        return []
+    return Parallel(n_jobs=min(max_workers, len(args_list)), backend="threading")(delayed(func)(*args) for args in args_list)
 
-    :param web3:
-        Web3 connection to the chain.
 
-    :param vault_addresses:
-        List of ERC-4626 vault smart contract addresses.
+def _resolve_vault(web3: Web3, addr: str) -> ERC4626Vault | None:
+    """Resolve a single ERC-4626 vault address.
 
     :return:
-        List of resolved vault instances.
+        Vault instance, or ``None`` if the address is not a valid vault.
     """
-    vaults = []
-    for addr in vault_addresses:
-        addr = Web3.to_checksum_address(addr)
-        try:
-            features = detect_vault_features(web3, addr)
-            vault = cast(ERC4626Vault, create_vault_instance(web3, addr, features=features))
-            if vault.is_valid():
-                logger.info("Resolved vault %s: %s", addr, vault.name)
-                vaults.append(vault)
-            else:
-                logger.warning("Skipping invalid vault at %s", addr)
-        except Exception as e:
-            logger.warning("Could not resolve vault at %s: %s", addr, e)
-    return vaults
+    addr = Web3.to_checksum_address(addr)
+    try:
+        features = detect_vault_features(web3, addr)
+        vault = cast(ERC4626Vault, create_vault_instance(web3, addr, features=features))
+        if vault.is_valid():
+            logger.info("Resolved vault %s: %s", addr, vault.name)
+            return vault
+        logger.warning("Skipping invalid vault at %s", addr)
+    except Exception as e:
+        logger.warning("Could not resolve vault at %s: %s", addr, e)
+    return None
+
+
+def _create_cctp_deployment(chain_name: str, cctp_chain_ids: dict[str, int]) -> CCTPDeployment | None:
+    """Allow CCTP bridging from a chain to all other CCTP-capable chains in the deployment.
+
+    :param cctp_chain_ids:
+        Chain name to chain id for the CCTP-capable chains being deployed.
+
+    :return:
+        CCTP deployment, or ``None`` if the chain has no CCTP peers.
+    """
+    if chain_name not in cctp_chain_ids:
+        return None
+
+    other_ids = [cid for name, cid in cctp_chain_ids.items() if name != chain_name]
+    if not other_ids:
+        return None
+
+    logger.info("CCTP configured on %s with destinations: %s", chain_name, other_ids)
+    return CCTPDeployment.create_for_chain(
+        chain_id=cctp_chain_ids[chain_name],
+        allowed_destinations=other_ids,
+    )
 
 
 def create_multichain_whitelisting_configuration(
@@ -324,6 +359,7 @@ def create_multichain_whitelisting_configuration(
     safe_threshold: int,
     safe_salt_nonce: int,
     source_chain: str | None = None,
+    max_workers: int = 16,
 ) -> dict[str, LagoonConfig]:
     """Build per-chain LagoonConfig dicts for mainnet deployment.
 
@@ -350,18 +386,32 @@ def create_multichain_whitelisting_configuration(
         Name of the source chain. Non-source chains are deployed as
         satellites (Safe + guard only, no vault contract).
 
+    :param max_workers:
+        Maximum number of parallel threads.
+
     :return:
         Per-chain LagoonConfig dict ready for ``deploy_multichain_lagoon_vault()``.
     """
-    configs: dict[str, LagoonConfig] = {}
-
     base_params = LagoonDeploymentParameters(
         underlying=None,  # auto-resolved per chain from USDC_NATIVE_TOKEN
         name="Multichain Strategy Vault",
         symbol="MSV",
     )
 
-    for chain_name, web3 in chain_web3.items():
+    # Chain ids come from the static name map, so CCTP peers are known before any config is built
+    cctp_chain_ids = {chain_name: CHAIN_ID_MAP[chain_name] for chain_name in chain_web3 if CHAIN_ID_MAP[chain_name] in CHAIN_ID_TO_CCTP_DOMAIN}
+
+    # Vault resolution is RPC bound and independent per chain and per vault,
+    # so resolve the vaults of all chains in one bounded thread pool
+    vault_jobs = [(chain_name, web3, addr) for chain_name, web3 in chain_web3.items() for addr in MAINNET_CHAIN_FEATURES.get(chain_name, {}).get("erc_4626_vaults_list", [])]
+    resolved = _run_threaded(_resolve_vault, [(web3, addr) for _chain_name, web3, addr in vault_jobs], max_workers)
+    chain_vaults: dict[str, list[ERC4626Vault]] = {chain_name: [] for chain_name in chain_web3}
+    for (chain_name, _web3, _addr), vault in zip(vault_jobs, resolved):
+        if vault is not None:
+            chain_vaults[chain_name].append(vault)
+
+    configs: dict[str, LagoonConfig] = {}
+    for chain_name in chain_web3:
         features = MAINNET_CHAIN_FEATURES.get(chain_name, {})
 
         kwargs: dict = {}
@@ -370,11 +420,11 @@ def create_multichain_whitelisting_configuration(
         if "hypercore_vaults" in features:
             kwargs["hypercore_vaults"] = features["hypercore_vaults"]
         if "erc_4626_vaults_list" in features:
-            kwargs["erc_4626_vaults"] = resolve_vaults(web3, features["erc_4626_vaults_list"])
+            kwargs["erc_4626_vaults"] = chain_vaults[chain_name]
 
         is_satellite = source_chain is not None and chain_name != source_chain
         configs[chain_name] = LagoonConfig(
-            parameters=deepcopy(base_params),
+            parameters=replace(base_params),
             asset_manager=None,
             asset_managers=[asset_manager],
             safe_owners=list(safe_owners),
@@ -382,25 +432,10 @@ def create_multichain_whitelisting_configuration(
             safe_salt_nonce=safe_salt_nonce,
             any_asset=True,
             satellite_chain=is_satellite,
+            cctp_deployment=_create_cctp_deployment(chain_name, cctp_chain_ids),
             **kwargs,
         )
 
-    # Configure CCTP for all CCTP-capable chains
-    cctp_chain_ids = []
-    for chain_name, web3 in chain_web3.items():
-        chain_id = web3.eth.chain_id
-        if chain_id in CHAIN_ID_TO_CCTP_DOMAIN:
-            cctp_chain_ids.append((chain_name, chain_id))
-
-    for chain_name, chain_id in cctp_chain_ids:
-        other_ids = [cid for name, cid in cctp_chain_ids if name != chain_name]
-        if other_ids:
-            configs[chain_name].cctp_deployment = CCTPDeployment.create_for_chain(
-                chain_id=chain_id,
-                allowed_destinations=other_ids,
-            )
-            logger.info("CCTP configured on %s with destinations: %s", chain_name, other_ids)
-
     return configs
 
 
@@ -449,12 +484,14 @@ def create_testnet_whitelisting_configuration(
         symbol="TSV",
     )
 
+    cctp_chain_ids = {chain_name: CHAIN_ID_MAP[chain_name] for chain_name in chain_web3 if CHAIN_ID_MAP[chain_name] in TESTNET_CHAIN_ID_TO_CCTP_DOMAIN}
+
     for chain_name in chain_web3:
         is_satellite = source_chain is not None and chain_name != source_chain
         if is_satellite:
             # Satellite chains: Safe + guard only, no Lagoon protocol
             configs[chain_name] = LagoonConfig(
-                parameters=deepcopy(base_params),
+                parameters=replace(base_params),
                 asset_manager=None,
                 asset_managers=[asset_manager],
                 safe_owners=list(safe_owners),
@@ -466,7 +503,7 @@ def create_testnet_whitelisting_configuration(
         else:
             # Source chain: full Lagoon protocol from scratch
             configs[chain_name] = LagoonConfig(
-                parameters=deepcopy(base_params),
+                parameters=replace(base_params),
                 asset_manager=None,
                 asset_managers=[asset_manager],
                 safe_owners=list(safe_owners),
@@ -478,8 +515,7 @@ def create_testnet_whitelisting_configuration(
                 deploy_retries=3,
             )
 
-    # Configure Uniswap V3 on testnet chains that have deployments
-    for chain_name in chain_web3:
+        # Configure Uniswap V3 on testnet chains that have deployments
         uni_key = TESTNET_UNISWAP_V3_KEYS.get(chain_name)
         if uni_key and uni_key in UNISWAP_V3_DEPLOYMENTS:
             d = UNISWAP_V3_DEPLOYMENTS[uni_key]
@@ -494,21 +530,8 @@ def create_testnet_whitelisting_configuration(
             configs[chain_name].uniswap_v3 = uni_v3
             logger.info("Uniswap V3 configured on %s (testnet)", chain_name)
 
-    # Configure CCTP between all testnet chains
-    cctp_chain_ids = []
-    for chain_name, web3 in chain_web3.items():
-        chain_id = web3.eth.chain_id
-        if chain_id in TESTNET_CHAIN_ID_TO_CCTP_DOMAIN:
-            cctp_chain_ids.append((chain_name, chain_id))
-
-    for chain_name, chain_id in cctp_chain_ids:
-        other_ids = [cid for name, cid in cctp_chain_ids if name != chain_name]
-        if other_ids:
-            configs[chain_name].cctp_deployment = CCTPDeployment.create_for_chain(
-                chain_id=chain_id,
-                allowed_destinations=other_ids,
-            )
-            logger.info("CCTP configured on %s (testnet) with destinations: %s", chain_name, other_ids)
+        # Configure CCTP between all testnet chains
+        configs[chain_name].cctp_deployment = _create_cctp_deployment(chain_name, cctp_chain_ids)
 
     return configs
 
@@ -516,24 +539,37 @@ def create_testnet_whitelisting_configuration(
 def setup_simulate_chains(
     chain_rpc_env_vars: dict[str, str],
     chain_id_map: dict[str, int],
+    max_workers: int = 16,
 ) -> tuple[dict[str, Web3], list[AnvilLaunch]]:
     """Create Anvil forks for all chains.
 
+    Forks are independent, so they are launched in parallel threads and
+    the start-up time is that of the slowest fork.
+
     :param chain_rpc_env_vars:
         Mapping of chain names to RPC environment variable names.
 
     :param chain_id_map:
         Mapping of chain names to expected chain IDs.
 
+    :param max_workers:
+        Maximum number of parallel threads.
+
     :return:
         Tuple of (chain_name->Web3 dict, list of AnvilLaunch handles for cleanup).
     """
-    anvil_launches = []
-    chain_web3 = {}
+    for env_var in chain_rpc_env_vars.values():
+        assert os.environ.get(env_var), f"{env_var} environment variable is required"
+
+    # Forks started so far, shut down if any fork fails.
+    # A fork that comes up after the shutdown closes itself.
+    started: list[AnvilLaunch] = []
+    started_lock = threading.Lock()
+    aborted = False
 
-    for chain_name, env_var in chain_rpc_env_vars.items():
-        rpc_url = os.environ.get(env_var)
-        assert rpc_url, f"{env_var} environment variable is required"
+    def _launch(chain_name: str, env_var: str) -> tuple[AnvilLaunch, Web3]:
+        threading.current_thread().name = f"fork-{chain_name}"
+        rpc_url = os.environ[env_var]
 
         # HyperEVM needs higher gas limit for TradingStrategyModuleV0 deployment
         # due to dual-block architecture (small blocks ~2-3M gas, large blocks ~30M)
@@ -547,38 +583,76 @@ def setup_simulate_chains(
 
         # fork_network_anvil handles space-separated multi-RPC URLs natively
         launch = fork_network_anvil(rpc_url, unlocked_addresses=unlocked, **extra_args)
-        anvil_launches.append(launch)
+        with started_lock:
+            registered = not aborted
+            if registered:
+                started.append(launch)
+        if not registered:
+            launch.close(log_level=logging.ERROR)
+            raise RuntimeError(f"Anvil fork for {chain_name} shut down, another fork failed to start")
+        logger.info("Anvil fork for %s (chain %d) started at %s", chain_name, chain_id, launch.json_rpc_url)
 
+        # Connect and verify in the same worker, so the readiness
+        # round trips of all forks overlap too
         web3 = create_multi_provider_web3(
             launch.json_rpc_url,
             default_http_timeout=(3, 250.0),
         )
-        assert web3.eth.chain_id == chain_id, f"Expected chain {chain_id} for {chain_name}, got {web3.eth.chain_id}"
-        chain_web3[chain_name] = web3
-        logger.info("Anvil fork for %s (chain %d) started at %s", chain_name, chain_id, launch.json_rpc_url)
+        actual_chain_id = web3.eth.chain_id
+        assert actual_chain_id == chain_id, f"Expected chain {chain_id} for {chain_name}, got {actual_chain_id}"
+        return launch, web3
 
+    launched = False
+    try:
+        launches = _run_threaded(_launch, list(chain_rpc_env_vars.items()), max_workers)
+        launched = True
+    finally:
+        if not launched:
+            with started_lock:
+                aborted = True
+            for launch in started:
+                launch.close(log_level=logging.ERROR)
+
+    anvil_launches = [launch for launch, _web3 in launches]
+    chain_web3 = {chain_name: web3 for chain_name, (_anvil, web3) in zip(chain_rpc_env_vars, launches)}
     return chain_web3, anvil_launches
 
 
 def setup_real_chains(
     chain_rpc_env_vars: dict[str, str],
+    chain_id_map: dict[str, int],
+    max_workers: int = 16,
 ) -> dict[str, Web3]:
     """Create Web3 connections for real networks.
 
+    Connections are checked in parallel threads, so a slow RPC endpoint
+    does not hold up the others.
+
     :param chain_rpc_env_vars:
         Mapping of chain names to RPC environment variable names.
 
+    :param chain_id_map:
+        Mapping of chain names to expected chain IDs.
+
+    :param max_workers:
+        Maximum number of parallel threads.
+
     :return:
         chain_name->Web3 dict.
     """
-    chain_web3 = {}
-    for chain_name, env_var in chain_rpc_env_vars.items():
-        rpc_url = os.environ.get(env_var)
-        assert rpc_url, f"{env_var} environment variable is required"
-        web3 = create_multi_provider_web3(rpc_url)
-        chain_web3[chain_name] = web3
-        logger.info("Connected to %s (chain %d)", chain_name, web3.eth.chain_id)
-    return chain_web3
+    for env_var in chain_rpc_env_vars.values():
+        assert os.environ.get(env_var), f"{env_var} environment variable is required"
+
+    def _connect(chain_name: str, env_var: str) -> Web3:
+        threading.current_thread().name = f"connect-{chain_name}"
+        web3 = create_multi_provider_web3(os.environ[env_var])
+        chain_id = web3.eth.chain_id
+        assert chain_id == chain_id_map[chain_name], f"Expected chain {chain_id_map[chain_name]} for {chain_name}, got {chain_id}"
+        logger.info("Connected to %s (chain %d)", chain_name, chain_id)
+        return web3
+
+    connections = _run_threaded(_connect, list(chain_rpc_env_vars.items()), max_workers)
+    return dict(zip(chain_rpc_env_vars, connections))
 
 
 def bridge_to_destinations(
@@ -591,6 +665,7 @@ def bridge_to_destinations(
     deployer: "HotWallet | None" = None,
     bridge_usdc_amount: Decimal = Decimal("0.1"),
     attestation_timeout: float = 2400.0,
+    max_workers: int = 16,
 ) -> list:
     """Bridge USDC from the source vault to each destination chain.
 
@@ -622,19 +697,23 @@ def bridge_to_destinations(
     :param attestation_timeout:
         Maximum seconds to wait for each attestation.
 
+    :param max_workers:
+        Maximum number of parallel threads for preparing test attesters.
+
     :return:
         List of :class:`~eth_defi.cctp.bridge.CCTPBridgeResult`.
     """
     source_vault = result.deployments[source_chain].vault
     dest_chain_names = [name for name in chain_web3 if name != source_chain]
 
+    # Convert once; human-readable totals are derived from the Decimal input
     bridge_amount = source_usdc.convert_to_raw(bridge_usdc_amount)
     total_bridge = bridge_amount * len(dest_chain_names)
+    total_bridge_human = bridge_usdc_amount * len(dest_chain_names)
 
     # Check source vault has sufficient USDC for bridging
     safe_balance = source_usdc.contract.functions.balanceOf(source_vault.safe_address).call()
     safe_balance_human = source_usdc.convert_to_decimals(safe_balance)
-    total_bridge_human = source_usdc.convert_to_decimals(total_bridge)
     print(f"\nSource vault USDC balance: {safe_balance_human} USDC")
     print(f"  Required for bridging: {total_bridge_human} USDC ({len(dest_chain_names)} destinations x {bridge_usdc_amount} USDC)")
     assert safe_balance >= total_bridge, f"Source vault needs {total_bridge_human} USDC but has {safe_balance_human} USDC. Fund the vault on {source_chain} first."
@@ -644,10 +723,9 @@ def bridge_to_destinations(
     # Prepare test attesters on destination forks (simulate mode only)
     test_attesters: dict[int, LocalAccount] | None = None
     if simulate:
-        test_attesters = {}
-        for chain_name in dest_chain_names:
-            dest_chain_id = chain_web3[chain_name].eth.chain_id
-            test_attesters[dest_chain_id] = replace_attester_on_fork(chain_web3[chain_name])
+        # Each destination is a separate Anvil fork, so patch them all at once
+        attesters = _run_threaded(replace_attester_on_fork, [(chain_web3[chain_name],) for chain_name in dest_chain_names], max_workers)
+        test_attesters = {CHAIN_ID_MAP[chain_name]: attester for chain_name, attester in zip(dest_chain_names, attesters)}
 
     # Build destination list for parallel bridging
     destinations = []
@@ -686,56 +764,63 @@ def swap_on_satellites(
     chain_web3: dict[str, Web3],
     result: LagoonMultichainDeployment,
     source_chain: str,
+    chain_configs: dict[str, LagoonConfig],
+    token_cache: TokenDiskCache,
     deployer: HotWallet | None = None,
     swap_fraction: Decimal = Decimal("0.5"),
+    max_workers: int = 16,
 ):
     """Swap bridged USDC to WETH on satellite chains via Uniswap V3.
 
     Proves the guard allows trading on satellite chains after bridging.
     Only swaps on satellite chains, not on the source chain.
 
+    :param chain_configs:
+        Per-chain configurations used for the deployment.
+        The Uniswap V3 deployment is read from here instead of probing it again.
+
+    :param token_cache:
+        Disk cache for USDC and WETH token details.
+
     :param deployer:
         HotWallet for signing on live networks.
         ``None`` for Anvil simulate mode (uses unlocked account).
 
     :param swap_fraction:
         Fraction of the satellite Safe's USDC balance to swap.
+
+    :param max_workers:
+        Maximum number of parallel threads.
     """
-    for chain_name, deployment in result.deployments.items():
-        if chain_name == source_chain or not deployment.is_satellite:
-            continue
+    satellite_chains = [chain_name for chain_name, deployment in result.deployments.items() if chain_name != source_chain and deployment.is_satellite]
+    if not satellite_chains:
+        return
+
+    def _swap_chain(chain_name: str, deployment):
+        threading.current_thread().name = f"swap-{chain_name}"
 
         web3 = chain_web3[chain_name]
-        chain_id = web3.eth.chain_id
+        chain_id = CHAIN_ID_MAP[chain_name]
 
-        uni_key = TESTNET_UNISWAP_V3_KEYS.get(chain_name)
-        if not uni_key or uni_key not in UNISWAP_V3_DEPLOYMENTS:
+        # Reuse the deployment probed when building the whitelisting configuration
+        uni_v3 = chain_configs[chain_name].uniswap_v3
+        if uni_v3 is None:
             print(f"  {chain_name}: no Uniswap V3, skipping swap")
-            continue
-
-        d = UNISWAP_V3_DEPLOYMENTS[uni_key]
-        uni_v3 = fetch_deployment_uni_v3(
-            web3,
-            factory_address=d["factory"],
-            router_address=d["router"],
-            position_manager_address=d["position_manager"],
-            quoter_address=d["quoter"],
-            router_v2=d.get("router_v2", False),
-        )
+            return
 
-        usdc = fetch_erc20_details(web3, USDC_NATIVE_TOKEN[chain_id])
+        usdc = fetch_erc20_details(web3, USDC_NATIVE_TOKEN[chain_id], chain_id=chain_id, cache=token_cache)
         weth_address = WRAPPED_NATIVE_TOKEN.get(chain_id)
         if not weth_address:
             print(f"  {chain_name}: no WETH configured, skipping swap")
-            continue
-        weth = fetch_erc20_details(web3, weth_address)
+            return
+        weth = fetch_erc20_details(web3, weth_address, chain_id=chain_id, cache=token_cache)
         safe_address = deployment.safe_address
 
         usdc_balance_raw = usdc.contract.functions.balanceOf(safe_address).call()
         swap_amount = int(usdc_balance_raw * swap_fraction)
         if swap_amount == 0:
             print(f"  {chain_name}: no USDC to swap")
-            continue
+            return
 
         print(f"  {chain_name}: swapping {usdc.convert_to_decimals(swap_amount)} USDC -> WETH...")
 
@@ -753,17 +838,6 @@ def swap_on_satellites(
         # Approve max USDC for Uniswap V3 router (avoids testnet RPC race
         # conditions where estimate_gas doesn't yet see a tight approval).
         approve_call = usdc.contract.functions.approve(uni_v3.swap_router.address, 2**256 - 1)
-        moduled_tx = satellite.transact_via_trading_strategy_module(approve_call)
-        if chain_wallet is not None:
-            tx_hash = chain_wallet.transact_and_broadcast_with_contract(moduled_tx)
-        else:
-            tx_hash = moduled_tx.transact({"from": result.deployments[source_chain].vault.safe_address, "gas": 1_000_000})
-        assert_transaction_success_with_explanation(web3, tx_hash)
-
-        # Small delay for testnet RPC state propagation — public endpoints
-        # like sepolia.base.org are load-balanced and estimate_gas may hit
-        # a backend that hasn't yet seen the approve confirmation.
-        time.sleep(3)
 
         # Swap USDC -> WETH
         swap_call = swap_with_slippage_protection(
@@ -775,11 +849,22 @@ def swap_on_satellites(
             pool_fees=[3000],  # 30 bps fee tier
             max_slippage=500,  # 5% — testnet pools have thin liquidity
         )
-        moduled_tx = satellite.transact_via_trading_strategy_module(swap_call)
+
+        # Approve and swap in a single transaction through the module's
+        # own multicall, so we do not need to wait for the approval
+        # to propagate across load-balanced testnet RPC backends
+        module = satellite.trading_strategy_module
+        moduled_tx = module.functions.multicall(
+            encode_multicalls(
+                [
+                    satellite.transact_via_trading_strategy_module(approve_call),
+                    satellite.transact_via_trading_strategy_module(swap_call),
+                ]
+            )
+        )
         if chain_wallet is not None:
-            # Use explicit gas limit to avoid estimate_gas hitting a stale
-            # RPC node that hasn't indexed the approval yet.
-            tx_hash = chain_wallet.transact_and_broadcast_with_contract(moduled_tx, gas_limit=500_000)
+            # Explicit gas limit covering both the approve and the swap
+            tx_hash = chain_wallet.transact_and_broadcast_with_contract(moduled_tx, gas_limit=600_000)
         else:
             tx_hash = moduled_tx.transact({"from": result.deployments[source_chain].vault.safe_address, "gas": 1_000_000})
         assert_transaction_success_with_explanation(web3, tx_hash)
@@ -787,6 +872,65 @@ def swap_on_satellites(
         weth_balance = weth.fetch_balance_of(safe_address)
         print(f"  {chain_name}: received {weth_balance} WETH")
 
+    # Each chain has its own Web3 and HotWallet nonce counter,
+    # so chains can be swapped concurrently
+    _run_threaded(_swap_chain, [(chain_name, result.deployments[chain_name]) for chain_name in satellite_chains], max_workers)
+
+
+def _fetch_vault_status(
+    web3: Web3,
+    chain_name: str,
+    deployment: LagoonAutomatedDeployment,
+    token_cache: TokenDiskCache,
+) -> tuple[Decimal, Decimal | None, Decimal | None]:
+    """Read the post-deployment status of one chain for the summary table.
+
+    Safe balances and the vault's ``totalAssets()`` / ``totalSupply()``
+    are bundled into one Multicall3 ``aggregate3`` ``eth_call``. Token details
+    come from the disk cache, so a warm run costs a single RPC round trip per chain.
+    Multicall3 lives at its canonical address on all chains this script targets.
+
+    :param token_cache:
+        Disk cache for USDC and WETH token details.
+
+    :return:
+        Tuple ``(safe_usdc, safe_weth, share_price)``.
+        WETH is ``None`` if the chain has no wrapped native token configured,
+        share price is ``None`` on satellite chains.
+    """
+    chain_id = CHAIN_ID_MAP[chain_name]
+    usdc = fetch_erc20_details(web3, USDC_NATIVE_TOKEN[chain_id], chain_id=chain_id, cache=token_cache)
+    weth = None
+    weth_address = WRAPPED_NATIVE_TOKEN.get(chain_id)
+    if weth_address:
+        try:
+            weth = fetch_erc20_details(web3, weth_address, chain_id=chain_id, cache=token_cache)
+        except Exception as e:
+            logger.warning("Could not fetch WETH details on chain %d: %s", chain_id, e)
+
+    def _encode(contract, fn: str, args: list, allow_failure: bool) -> tuple[HexAddress, bool, bytes]:
+        return contract.address, allow_failure, bytes.fromhex(contract.encode_abi(abi_element_identifier=fn, args=args)[2:])
+
+    tokens = [usdc, weth] if weth else [usdc]
+    calls = [_encode(token.contract, "balanceOf", [deployment.safe_address], allow_failure=True) for token in tokens]
+    if not deployment.is_satellite:
+        # The vault was deployed by this script, so a failing read is a real error
+        vault_contract = deployment.vault.vault_contract
+        calls += [_encode(vault_contract, "totalAssets", [], allow_failure=False), _encode(vault_contract, "totalSupply", [], allow_failure=False)]
+
+    multicall = get_multicall_contract(web3, address=MULTICALL_DEPLOY_ADDRESS)
+    values = [int.from_bytes(return_data, "big") if success else None for success, return_data in multicall.functions.aggregate3(calls).call()]
+
+    balances = [token.convert_to_decimals(raw) if raw is not None else None for token, raw in zip(tokens, values)]
+    share_price = None
+    if not deployment.is_satellite:
+        total_assets_raw, total_supply_raw = values[len(tokens) :]
+        vault = deployment.vault
+        total_supply = vault.share_token.convert_to_decimals(total_supply_raw)
+        share_price = vault.underlying_token.convert_to_decimals(total_assets_raw) / total_supply if total_supply else Decimal(0)
+
+    return balances[0], balances[1] if weth else None, share_price
+
 
 def main():
     threading.current_thread().name = "main"
@@ -797,6 +941,7 @@ def main():
     salt_nonce = int(os.environ.get("SALT_NONCE", str(random.randint(1, 2**32))))
     usdc_amount = Decimal(os.environ.get("USDC_AMOUNT", "2"))
     bridged_usdc_amount = Decimal(os.environ.get("BRIDGED_USDC_AMOUNT", "0.1"))
+    max_workers = int(os.environ.get("MAX_WORKERS", "16"))
 
     assert network in ("mainnet", "testnet"), f"NETWORK must be 'mainnet' or 'testnet', got '{network}'"
 
@@ -835,13 +980,14 @@ def main():
     print()
 
     anvil_launches: list[AnvilLaunch] = []
+    token_cache = TokenDiskCache()
 
     try:
         # --- Step 1: Set up chain connections ---
         if simulate:
-            chain_web3, anvil_launches = setup_simulate_chains(chain_rpc_env_vars, chain_id_map)
+            chain_web3, anvil_launches = setup_simulate_chains(chain_rpc_env_vars, chain_id_map, max_workers=max_workers)
         else:
-            chain_web3 = setup_real_chains(chain_rpc_env_vars)
+            chain_web3 = setup_real_chains(chain_rpc_env_vars, chain_id_map, max_workers=max_workers)
 
         # --- Step 2: Set up deployer wallet ---
         if simulate:
@@ -865,8 +1011,9 @@ def main():
         if not simulate:
             print("\nChecking deployer balances...")
             insufficient = []
-            for chain_name, web3 in chain_web3.items():
-                balance_wei = web3.eth.get_balance(deployer.address)
+            # One independent RPC read per chain, so query all chains at once
+            balances_wei = _run_threaded(lambda web3: web3.eth.get_balance(deployer.address), [(web3,) for web3 in chain_web3.values()], max_workers)
+            for chain_name, balance_wei in zip(chain_web3, balances_wei):
                 balance_eth = balance_wei / 10**18
                 status = "OK" if balance_wei > 0 else "EMPTY"
                 print(f"  {chain_name}: {balance_eth:.6f} native ({status})")
@@ -896,6 +1043,7 @@ def main():
                 safe_threshold=safe_threshold,
                 safe_salt_nonce=salt_nonce,
                 source_chain=source_chain,
+                max_workers=max_workers,
             )
 
         for chain_name, config in chain_configs.items():
@@ -933,13 +1081,12 @@ def main():
                 print(deployment.format_whitelisted_items(indent="      "))
 
         # --- Step 7: Fund source vault for bridging ---
-        source_chain_id = chain_web3[source_chain].eth.chain_id
+        source_chain_id = CHAIN_ID_MAP[source_chain]
+        source_web3 = chain_web3[source_chain]
         source_usdc_address = USDC_NATIVE_TOKEN[source_chain_id]
-        source_usdc = fetch_erc20_details(chain_web3[source_chain], source_usdc_address)
+        source_usdc = fetch_erc20_details(source_web3, source_usdc_address, chain_id=source_chain_id, cache=token_cache)
         source_vault = result.deployments[source_chain].vault
 
-        source_web3 = chain_web3[source_chain]
-
         if simulate:
             if source_chain_id in USDC_WHALE:
                 # Mainnet simulate: transfer USDC from whale to deployer
@@ -998,6 +1145,7 @@ def main():
             deployer=deployer if not simulate else None,
             bridge_usdc_amount=bridged_usdc_amount,
             attestation_timeout=3600.0 if is_testnet else 2400.0,
+            max_workers=max_workers,
         )
 
         # --- Step 8b: Swap bridged USDC to WETH on satellite chains ---
@@ -1007,7 +1155,10 @@ def main():
                 chain_web3=chain_web3,
                 result=result,
                 source_chain=source_chain,
+                chain_configs=chain_configs,
+                token_cache=token_cache,
                 deployer=deployer if not simulate else None,
+                max_workers=max_workers,
             )
 
         # --- Step 9: Print final summary ---
@@ -1021,30 +1172,22 @@ def main():
         print("\n" + "=" * 70)
         print("Vault status")
         print("=" * 70)
+        # Read all chains in parallel, then print in a stable order
+        status_rows = _run_threaded(_fetch_vault_status, [(chain_web3[chain_name], chain_name, deployment, token_cache) for chain_name, deployment in result.deployments.items()], max_workers)
+        statuses = dict(zip(result.deployments, status_rows))
+
         for chain_name, deployment in sorted(result.deployments.items()):
-            web3 = chain_web3[chain_name]
-            chain_id = web3.eth.chain_id
-            usdc_address = USDC_NATIVE_TOKEN[chain_id]
-            usdc = fetch_erc20_details(web3, usdc_address)
-            safe_balance = usdc.fetch_balance_of(deployment.safe_address)
+            safe_balance, weth_balance, share_price = statuses[chain_name]
             print(f"  {chain_name}{'  (satellite)' if deployment.is_satellite else ''}:")
             if deployment.is_satellite:
                 print(f"    Vault:       N/A (satellite chain)")
             else:
                 print(f"    Vault:       {deployment.vault.address}")
-                share_price = deployment.vault.fetch_share_price("latest")
                 print(f"    Share price: {share_price}")
             print(f"    Safe:        {deployment.safe_address}")
             print(f"    Safe USDC:   {safe_balance} USDC")
-            weth_address = WRAPPED_NATIVE_TOKEN.get(chain_id)
-            if weth_address:
-                try:
-                    weth = fetch_erc20_details(web3, weth_address)
-                    weth_balance = weth.fetch_balance_of(deployment.safe_address)
-                    if weth_balance > 0:
-                        print(f"    Safe WETH:   {weth_balance} WETH")
-                except Exception as e:
-                    logger.warning("Could not fetch WETH balance on chain %d: %s", chain_id, e)
+            if weth_balance:
+                print(f"    Safe WETH:   {weth_balance} WETH")
             if deployment.whitelisted_items:
                 print(f"    Whitelisted:")
                 print(deployment.format_whitelisted_items(indent="      "))
@@ -1059,20 +1202,17 @@ def main():
             try:
                 import hypersync as _hypersync
 
-                source_chain_id_for_scan = chain_web3[source_chain].eth.chain_id
-                source_web3_for_scan = chain_web3[source_chain]
-
                 from eth_defi.hypersync.server import get_hypersync_server
 
-                hs_url = get_hypersync_server(source_chain_id_for_scan)
+                hs_url = get_hypersync_server(source_chain_id)
                 hs_client = _hypersync.HypersyncClient(_hypersync.ClientConfig(url=hs_url, api_token=hypersync_api_key))
 
                 # Build chain_id -> Web3 map for CCTP chain following
-                readback_chain_web3 = {w.eth.chain_id: w for w in chain_web3.values()}
+                readback_chain_web3 = {CHAIN_ID_MAP[name]: w for name, w in chain_web3.items()}
 
                 events, module_addresses = fetch_guard_config_events(
                     safe_address=result.safe_address,
-                    web3=source_web3_for_scan,
+                    web3=source_web3,
                     hypersync_client=hs_client,
                     chain_web3=readback_chain_web3,
                     follow_cctp=True,
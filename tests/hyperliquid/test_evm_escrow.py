@@ -298,3 +298,40 @@ def test_wait_for_evm_escrow_clear_times_out_if_spot_balance_never_arrives():
                         timeout=3.0,
                         poll_interval=1.0,
                     )
+
+
+def test_wait_for_evm_escrow_clear_backs_off_poll_interval():
+    """Grow the poll interval after the initial delay when backoff is set.
+
+    1. Mock three pending escrow states followed by a cleared state.
+    2. Run ``wait_for_evm_escrow_clear()`` with a short poll interval, backoff and cap.
+    3. Verify the initial delay is kept and later sleeps back off up to the cap.
+    """
+    from eth_defi.hyperliquid.evm_escrow import wait_for_evm_escrow_clear
+
+    pending_state = SimpleNamespace(
+        evm_escrows=[SimpleNamespace(coin="USDC", total=Decimal("10"))],
+        balances=[],
+    )
+    cleared_state = SimpleNamespace(evm_escrows=[], balances=[])
+
+    # 1. Mock three pending escrow states followed by a cleared state.
+    with patch(
+        "eth_defi.hyperliquid.evm_escrow.fetch_spot_clearinghouse_state",
+        side_effect=[pending_state, pending_state, pending_state, cleared_state],
+    ):
+        with patch("eth_defi.hyperliquid.evm_escrow.time.sleep") as mock_sleep:
+            with patch("eth_defi.hyperliquid.evm_escrow.time.time", return_value=0.0):
+                # 2. Run wait_for_evm_escrow_clear() with a short poll interval, backoff and cap.
+                wait_for_evm_escrow_clear(
+                    session=object(),
+                    user="0x0000000000000000000000000000000000000001",
+                    timeout=60.0,
+                    poll_interval=0.25,
+                    initial_delay=2.0,
+                    backoff=2.0,
+                    max_poll_interval=1.0,
+                )
+
+    # 3. Verify the initial delay is kept and later sleeps back off up to the cap.
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [2.0, 0.25, 0.5, 1.0]
@@ -2,6 +2,8 @@
 
 1. Verify first-time vault deposits must still reach the expected amount within tolerance.
 2. Verify tiny non-zero equity no longer falsely confirms a first deposit.
+3. Verify vault equity change polling ignores PnL drift and waits for the deposit amount.
+4. Verify vault equity change polling detects a full withdrawal removing the position.
 """
 
 import datetime
@@ -14,6 +16,7 @@ from eth_defi.hyperliquid.api import (
     HypercoreDepositVerificationError,
     UserVaultEquity,
     wait_for_vault_deposit_confirmation,
+    wait_for_vault_equity_change,
 )
 
 
@@ -203,3 +206,116 @@ def test_existing_deposit_confirms_despite_nav_drift(
 
     # 3. Verify the helper confirms the deposit under the default 5% tolerance.
     assert result.equity == Decimal("757.794214")
+
+
+@patch("eth_defi.hyperliquid.api.time.sleep")
+@patch("eth_defi.hyperliquid.api.fetch_user_vault_equities")
+def test_vault_equity_change_ignores_pnl_drift(
+    mock_fetch,
+    mock_sleep,
+):
+    """Keep polling while the vault equity only drifts with PnL.
+
+    1. Mock equity reads where the target and another vault drift, followed by a read with the deposit landed.
+    2. Call ``wait_for_vault_equity_change()`` expecting a 5 USDC deposit.
+    3. Verify the drifted reads are ignored and the poll interval backs off.
+    """
+    session = MagicMock()
+    other_vault = "0x0000000000000000000000000000000000000003"
+    baseline = [_make_equity(Decimal("100"))]
+
+    # 1. Mock equity reads where the target and another vault drift, followed by a read with the deposit landed.
+    mock_fetch.side_effect = [
+        [_make_equity(Decimal("100.30"))],
+        [
+            _make_equity(Decimal("99.80")),
+            UserVaultEquity(vault_address=other_vault, equity=Decimal("50"), locked_until=datetime.datetime(2030, 1, 1)),
+        ],
+        [_make_equity(Decimal("104.90"))],
+    ]
+
+    # 2. Call wait_for_vault_equity_change() expecting a 5 USDC deposit.
+    result = wait_for_vault_equity_change(
+        session,
+        user=USER_ADDR,
+        vault_address=VAULT_ADDR,
+        baseline_equities=baseline,
+        expected_change=Decimal("5"),
+        timeout=30.0,
+        initial_interval=0.5,
+        backoff=2.0,
+        max_interval=1.5,
+    )
+
+    # 3. Verify the drifted reads are ignored and the poll interval backs off.
+    assert result[0].equity == Decimal("104.90")
+    assert mock_fetch.call_count == 3
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 1.0, 1.5]
+
+
+@patch("eth_defi.hyperliquid.api.time.sleep")
+@patch("eth_defi.hyperliquid.api.fetch_user_vault_equities")
+def test_vault_equity_change_detects_full_withdrawal(
+    mock_fetch,
+    _mock_sleep,
+):
+    """Treat a disappearing vault position as a settled withdrawal.
+
+    1. Mock an unchanged equity read followed by a read without the vault position.
+    2. Call ``wait_for_vault_equity_change()`` expecting a withdrawal larger than the position.
+    3. Verify the empty equities are returned once the position disappears.
+    """
+    session = MagicMock()
+    baseline = [_make_equity(Decimal("4.98"))]
+
+    # 1. Mock an unchanged equity read followed by a read without the vault position.
+    mock_fetch.side_effect = [baseline, []]
+
+    # 2. Call wait_for_vault_equity_change() expecting a withdrawal larger than the position.
+    result = wait_for_vault_equity_change(
+        session,
+        user=USER_ADDR,
+        vault_address=VAULT_ADDR,
+        baseline_equities=baseline,
+        expected_change=Decimal("-5"),
+    )
+
+    # 3. Verify the empty equities are returned once the position disappears.
+    assert result == []
+    assert mock_fetch.call_count == 2
+
+
+@patch("eth_defi.hyperliquid.api.time.time")
+@patch("eth_defi.hyperliquid.api.time.sleep")
+@patch("eth_defi.hyperliquid.api.fetch_user_vault_equities")
+def test_vault_equity_change_times_out_on_drift_only(
+    mock_fetch,
+    _mock_sleep,
+    mock_time,
+):
+    """Raise when only PnL drift is observed within the timeout.
+
+    1. Mock a clock that expires after two polls and equity reads that only drift.
+    2. Call ``wait_for_vault_equity_change()`` expecting a 5 USDC deposit.
+    3. Verify ``TimeoutError`` is raised instead of returning the drifted equities.
+    """
+    session = MagicMock()
+    baseline = [_make_equity(Decimal("100"))]
+
+    # 1. Mock a clock that expires after two polls and equity reads that only drift.
+    mock_time.side_effect = [0.0, 0.0, 10.0, 31.0]
+    mock_fetch.side_effect = [[_make_equity(Decimal("100.50"))], [_make_equity(Decimal("101"))]]
+
+    # 2. Call wait_for_vault_equity_change() expecting a 5 USDC deposit.
+    with pytest.raises(TimeoutError):
+        wait_for_vault_equity_change(
+            session,
+            user=USER_ADDR,
+            vault_address=VAULT_ADDR,
+            baseline_equities=baseline,
+            expected_change=Decimal("5"),
+            timeout=30.0,
+        )
+
+    # 3. Verify TimeoutError is raised instead of returning the drifted equities.
+    assert mock_fetch.call_count == 2